@@ -2,19 +2,43 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
 import tkinter.font as tkfont
 from tkinter import Text
-import ast
-import threading
-import subprocess
+import importlib.util
 import sys
 import os
-import json
+import math
+import re
+import shutil
+import signal
+import subprocess
+import threading
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-try:
-    from PIL import Image, ImageTk
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
-    print("PIL not available - using fallback buttons")
+
+
+# PIL and NumPy are imported on first use to keep editor startup fast
+@lru_cache(maxsize=None)
+def get_pil():
+    """Return (Image, ImageTk) from PIL, or None if PIL is not installed"""
+    try:
+        from PIL import Image, ImageTk
+    except ImportError:
+        print("PIL not available - using fallback images")
+        return None
+    return Image, ImageTk
+
+
+@lru_cache(maxsize=None)
+def get_numpy():
+    """Return the numpy module, or None if NumPy is not installed"""
+    try:
+        import numpy
+    except ImportError:
+        print("NumPy not available - using pure Python gradients")
+        return None
+    return numpy
+
 
 # Import splash screen
 try:
@@ -24,12 +48,12 @@ except ImportError:
     SPLASH_AVAILABLE = False
     print("Splash screen not available")
 
-# Import the Asset Manager
-try:
-    from asset_manager.asset_manager import AssetManagerWindow
-    ASSET_MANAGER_AVAILABLE = True
-except ImportError:
-    ASSET_MANAGER_AVAILABLE = False
+# The Asset Manager is imported when it is first opened; without importing
+# anything, check for the package and the Pillow it imports at module level
+ASSET_MANAGER_AVAILABLE = all(
+    importlib.util.find_spec(name) is not None
+    for name in ("asset_manager", "PIL"))
+if not ASSET_MANAGER_AVAILABLE:
     print("Asset Manager not available - missing dependencies")
 
 # Check if Game Builder is available (either as file or in bundled executable)
@@ -37,23 +61,270 @@ GAME_BUILDER_AVAILABLE = (os.path.exists(os.path.join(os.path.dirname(__file__),
                           getattr(sys, 'frozen', False))
 
 
+@lru_cache(maxsize=None)
+def find_asset(filename):
+    """Return the first existing location of a bundled asset, or None"""
+    candidates = (
+        filename,  # Current directory
+        os.path.join("assets", filename),  # Bundled assets
+        os.path.join(os.path.dirname(__file__), filename),  # Script directory
+        os.path.join(os.path.dirname(__file__), "assets",
+                     filename)  # Script assets
+    )
+    for path in candidates:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+@lru_cache(maxsize=256)
+def project_root_of(file_path):
+    """Return the Projects/<name> directory containing file_path, or None"""
+    parts = Path(file_path).parts
+    if "Projects" in parts:
+        projects_index = parts.index("Projects")
+        if projects_index + 1 < len(parts):
+            return str(Path("Projects") / parts[projects_index + 1])
+    return None
+
+
+def write_text_file(path, content):
+    """Write text as UTF-8, replacing the file atomically"""
+    # Replace the symlink's target rather than the link itself
+    path = os.path.realpath(path)
+    existed = os.path.exists(path)
+
+    # The Text widget only holds '\n'; keep CRLF files as CRLF
+    newline = '\n'
+    if existed:
+        try:
+            with open(path, 'rb') as file:
+                if b'\r\n' in file.read(64 * 1024):
+                    newline = '\r\n'
+        except OSError:
+            pass
+
+    tmp_path = f"{path}.tmp"
+    # Large buffers are encoded by the codec in 1 MB pieces instead of
+    # being copied into one bytes object first
+    buffering = 1 << 20 if len(content) > 1 << 20 else -1
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', newline=newline,
+                  buffering=buffering) as file:
+            file.write(content)
+        if existed:
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+# Two-digit hex string for every byte value
+_HEX = [f"{i:02x}" for i in range(256)]
+
+
+@lru_cache(maxsize=4096)
+def hex_to_rgb(hex_color):
+    """Convert hex color to RGB tuple"""
+    hex_color = hex_color.lstrip('#')
+    return tuple(int(hex_color[i:i + 2], 16) for i in (0, 2, 4))
+
+
+@lru_cache(maxsize=4096)
+def rgb_to_hex(rgb):
+    """Convert RGB tuple to hex color"""
+    return f"#{_HEX[int(rgb[0])]}{_HEX[int(rgb[1])]}{_HEX[int(rgb[2])]}"
+
+
+def gradient_hex(start_rgb, end_rgb, count, divisor):
+    """Interpolate count gradient steps (factor = i / divisor) to hex colors"""
+    np = get_numpy()
+    if np is not None:
+        start = np.array(start_rgb, dtype=float)
+        end = np.array(end_rgb, dtype=float)
+        if divisor:
+            factors = np.arange(count) / divisor
+        else:
+            factors = np.zeros(count)
+        rgb = (start + factors[:, None] * (end - start)).astype(np.uint8)
+        return [f"#{_HEX[r]}{_HEX[g]}{_HEX[b]}" for r, g, b in rgb.tolist()]
+
+    colors = []
+    for i in range(count):
+        factor = i / divisor if divisor else 0
+        colors.append(
+            rgb_to_hex(
+                tuple(int(start_rgb[c] + factor * (end_rgb[c] - start_rgb[c]))
+                      for c in range(3))))
+    return colors
+
+
+@lru_cache(maxsize=64)
+def rounded_row_spans(width, height, corner_radius):
+    """Return (y, left_x, right_x) for every non-empty row of a rounded rectangle"""
+    spans = []
+
+    # Calculate corner points for rounded rectangle
+    r = min(corner_radius, width // 2, height // 2)
+
+    # For each y position, calculate the x boundaries
+    for y in range(height):
+        # Calculate left and right boundaries for this y position
+        if y < r:
+            # Top corners
+            offset = math.sqrt(r * r - (r - y) * (r - y)) if (r - y) <= r else r
+            left_x = max(0, int(r - offset))
+            right_x = min(width, int(width - r + offset))
+        elif y >= height - r:
+            # Bottom corners
+            dy = y - (height - r - 1)
+            offset = math.sqrt(r * r - dy * dy) if dy <= r else r
+            left_x = max(0, int(r - offset))
+            right_x = min(width, int(width - r + offset))
+        else:
+            # Middle section - full width
+            left_x = 0
+            right_x = width
+
+        if right_x > left_x:
+            spans.append((y, left_x, right_x))
+
+    return tuple(spans)
+
+
+@lru_cache(maxsize=32)
+def render_rounded_gradient(width, height, corner_radius, start_rgb, end_rgb):
+    """Render a left-to-right gradient clipped to a rounded rectangle"""
+    spans = rounded_row_spans(width, height, corner_radius)
+    pil = get_pil()
+    np = get_numpy()
+    if pil is not None and np is not None:
+        Image, ImageTk = pil
+        # One row of colors serves every y; pixels outside stay transparent
+        start = np.array(start_rgb, dtype=float)
+        end = np.array(end_rgb, dtype=float)
+        factors = np.arange(width) / (width - 1) if width > 1 else np.zeros(width)
+        row = (start + factors[:, None] * (end - start)).astype(np.uint8)
+        pixels = np.zeros((height, width, 4), dtype=np.uint8)
+        for y, left_x, right_x in spans:
+            pixels[y, left_x:right_x, :3] = row[left_x:right_x]
+            pixels[y, left_x:right_x, 3] = 255
+        return ImageTk.PhotoImage(Image.fromarray(pixels, 'RGBA'))
+
+    # Fallback: put one row string per span, leaving the corners unset
+    colors = gradient_hex(start_rgb, end_rgb, width, width - 1)
+    image = tk.PhotoImage(width=width, height=height)
+    for y, left_x, right_x in spans:
+        image.put('{' + ' '.join(colors[left_x:right_x]) + '}', to=(left_x, y))
+    return image
+
+
+# (cos, sin) for every 5 degree step of a full circle
+_ARC_TRIG = {
+    angle: (math.cos(math.radians(angle)), math.sin(math.radians(angle)))
+    for angle in range(0, 361, 5)
+}
+
+
+@lru_cache(maxsize=64)
+def rounded_rectangle_points(x1, y1, x2, y2, radius=12):
+    """Return the polygon points of a rounded rectangle"""
+    points = []
+
+    # Ensure radius doesn't exceed half of width or height
+    max_radius = min((x2 - x1) // 2, (y2 - y1) // 2)
+    radius = min(radius, max_radius)
+
+    # Corner centers and their arcs: top-left, top-right,
+    # bottom-right, bottom-left
+    corners = ((x1 + radius, y1 + radius, 90, 181),
+               (x2 - radius, y1 + radius, 0, 91),
+               (x2 - radius, y2 - radius, 270, 361),
+               (x1 + radius, y2 - radius, 180, 271))
+    for cx, cy, first, last in corners:
+        for angle in range(first, last, 5):
+            cos_a, sin_a = _ARC_TRIG[angle]
+            points.extend([cx + radius * cos_a, cy + radius * sin_a])
+
+    return tuple(points)
+
+
+# Python keywords
+PYTHON_KEYWORDS = (
+    'def', 'class', 'import', 'from', 'if', 'else', 'elif', 'try',
+    'except', 'finally', 'for', 'while', 'in', 'not', 'and', 'or',
+    'is', 'None', 'True', 'False', 'return', 'break', 'continue',
+    'pass', 'with', 'as', 'lambda', 'yield', 'global', 'nonlocal'
+)
+
+# Syntax highlighting patterns, one per tag
+_COMMENT_PATTERN = r'#.*?$'
+_STRING_PATTERN = r'"(?:[^"\\\n]|\\.)*"' + r"|'(?:[^'\\\n]|\\.)*'"
+_KEYWORD_PATTERN = r'\b(?:' + '|'.join(map(re.escape, PYTHON_KEYWORDS)) + r')\b'
+_NUMBER_PATTERN = r'\b\d+\.?\d*\b'
+
+# Every token class in one alternation, so the buffer is scanned once.
+# Group names match the tag names.
+_HIGHLIGHT_RE = re.compile(
+    f'(?P<comment>{_COMMENT_PATTERN})'
+    f'|(?P<string>{_STRING_PATTERN})'
+    f'|(?P<keyword>{_KEYWORD_PATTERN})'
+    f'|(?P<number>{_NUMBER_PATTERN})', re.MULTILINE)
+
+
+def text_end(text, line, col):
+    """Return the (line, column) reached after text inserted at line.col"""
+    newlines = text.count('\n')
+    if newlines:
+        return line + newlines, len(text) - text.rfind('\n') - 1
+    return line, col + len(text)
+
+
+# Keys whose release cannot have edited a Text widget
+NAVIGATION_KEYS = frozenset({
+    'Left', 'Right', 'Up', 'Down', 'Home', 'End', 'Prior', 'Next',
+    'Shift_L', 'Shift_R', 'Control_L', 'Control_R', 'Alt_L', 'Alt_R',
+    'Caps_Lock', 'Escape'
+})
+
+
+def column_offset(index, count):
+    """Return the 'line.col' index count characters right of index on its line"""
+    line, col = index.split('.')
+    return f"{line}.{int(col) + count}"
+
+
 class SyntaxHighlighter:
     """Advanced syntax highlighter for Python and JavaScript"""
 
+    # Milliseconds without edits before schedule_highlight runs
+    HIGHLIGHT_DELAY = 150
+
     def __init__(self, text_widget):
         self.text_widget = text_widget
+        # (first, last) lines edited since the last pass, None if unchanged
+        self._dirty = None
+        self._line_count = 1
+        # Line number -> hash of the text it was last tagged with, valid
+        # while the buffer keeps _hashed_line_count lines
+        self._line_hashes = {}
+        self._hashed_line_count = 0
+        self._viewport_job = None
+        self._highlight_job = None
         self.setup_tags()
+        self.text_widget.bind('<<Modified>>', self.mark_dirty, add='+')
+        self.text_widget.bind('<<Rehighlight>>',
+                              lambda e: self.highlight_syntax(),
+                              add='+')
+        self.text_widget.bind('<Configure>', self.schedule_viewport, add='+')
+        self.text_widget.bind('<Destroy>', self.cancel_pending, add='+')
 
     def setup_tags(self):
         """Configure syntax highlighting tags"""
-        # Python keywords
-        python_keywords = [
-            'def', 'class', 'import', 'from', 'if', 'else', 'elif', 'try',
-            'except', 'finally', 'for', 'while', 'in', 'not', 'and', 'or',
-            'is', 'None', 'True', 'False', 'return', 'break', 'continue',
-            'pass', 'with', 'as', 'lambda', 'yield', 'global', 'nonlocal'
-        ]
-
         self.text_widget.tag_configure("keyword", foreground="#569CD6")
         self.text_widget.tag_configure("string", foreground="#CE9178")
         self.text_widget.tag_configure("comment", foreground="#6A9955")
@@ -61,57 +332,148 @@ class SyntaxHighlighter:
         self.text_widget.tag_configure("operator", foreground="#D4D4D4")
         self.text_widget.tag_configure("builtin", foreground="#DCDCAA")
 
+    def mark_dirty(self, event=None):
+        """Record the line touched by an edit"""
+        widget = self.text_widget
+        if not widget.edit_modified():
+            return
+        line = int(widget.index("insert").split('.')[0])
+        if self._dirty is None:
+            self._dirty = (line, line)
+        else:
+            self._dirty = (min(self._dirty[0], line), max(self._dirty[1], line))
+        # Re-arm <<Modified>> for the next edit
+        widget.edit_modified(False)
+
     def highlight_syntax(self, event=None):
         """Configure syntax highlighting text"""
-        # Python keywords
-        python_keywords = [
-            'def', 'class', 'import', 'from', 'if', 'else', 'elif', 'try',
-            'except', 'finally', 'for', 'while', 'in', 'not', 'and', 'or',
-            'is', 'None', 'True', 'False', 'return', 'break', 'continue',
-            'pass', 'with', 'as', 'lambda', 'yield', 'global', 'nonlocal'
-        ]
+        widget = self.text_widget
+        line_count = int(widget.index("end-1c").split('.')[0])
+
+        if event is None:
+            # Explicit call: highlight what is on screen, the rest of the
+            # buffer is highlighted as it scrolls into view
+            self._dirty = None
+            # Tk queues <<Modified>>; clearing the flag turns the event for
+            # the edit that caused this call into a no-op
+            widget.edit_modified(False)
+            self._line_count = line_count
+            self._line_hashes.clear()
+            self.highlight_viewport()
+            return
+
+        if self._dirty is None:
+            # Cursor movement or click without an edit
+            return
 
-        # Get all text
-        content = self.text_widget.get("1.0", "end-1c")
+        # Lines inserted by this edit end at the cursor
+        insert_line = int(widget.index("insert").split('.')[0])
+        added = max(line_count - self._line_count, 0)
+        first = max(min(self._dirty[0], insert_line - added), 1)
+        last = min(max(self._dirty[1], insert_line), line_count)
+        self._dirty = None
+        self._line_count = line_count
+
+        self.highlight_range(f"{first}.0", f"{last}.0", force=True)
+        # The range above is a guess from the cursor; edits that keep the
+        # line count (pasting over a selection, undo) can touch other
+        # lines. The hash memo makes re-checking the visible lines cheap.
+        self.highlight_viewport()
+
+    def highlight_viewport(self):
+        """Highlight the lines currently visible in the widget"""
+        self._viewport_job = None
+        widget = self.text_widget
+        self.highlight_range("@0,0", f"@0,{widget.winfo_height()}")
+
+    def schedule_viewport(self, *args):
+        """Highlight the visible lines once the widget is idle"""
+        if self._viewport_job is None:
+            self._viewport_job = self.text_widget.after_idle(
+                self.highlight_viewport)
+
+    def schedule_highlight(self, event=None):
+        """Highlight the edited lines once typing pauses"""
+        if self._highlight_job is not None:
+            self.text_widget.after_cancel(self._highlight_job)
+        self._highlight_job = self.text_widget.after(
+            self.HIGHLIGHT_DELAY, self._run_scheduled_highlight, event)
+
+    def _run_scheduled_highlight(self, event):
+        self._highlight_job = None
+        self.highlight_syntax(event)
+
+    def cancel_pending(self, event=None):
+        if self._viewport_job is not None:
+            self.text_widget.after_cancel(self._viewport_job)
+            self._viewport_job = None
+        if self._highlight_job is not None:
+            self.text_widget.after_cancel(self._highlight_job)
+            self._highlight_job = None
+
+    def highlight_range(self, start_idx, end_idx, force=False):
+        """Re-highlight the lines from start_idx to end_idx
+
+        Unless force is set, lines whose text is unchanged since they were
+        last tagged are skipped; tags move with the text they cover.
+        """
+        widget = self.text_widget
+        first = int(widget.index(start_idx).split('.')[0])
+        end = widget.index(f"{end_idx} lineend")
+        lines = widget.get(f"{first}.0", end).split('\n')
+
+        hashes = self._line_hashes
+        line_count = int(widget.index("end-1c").split('.')[0])
+        if line_count != self._hashed_line_count:
+            # Lines were added or removed, so line numbers moved
+            hashes.clear()
+            self._hashed_line_count = line_count
+        changed = []
+        for line_no, line in enumerate(lines, first):
+            line_hash = hash(line)
+            if force or hashes.get(line_no) != line_hash:
+                hashes[line_no] = line_hash
+                changed.append(line_no)
+        if not changed:
+            return
 
-        # Clear existing tags
+        # Retag the span between the first and last changed line
+        lines = lines[changed[0] - first:changed[-1] - first + 1]
+        first = changed[0]
+        start = f"{first}.0"
+        end = f"{changed[-1]}.end"
+
+        # Clear existing tags on the affected lines only
         for tag in ["keyword", "string", "comment", "number", "builtin"]:
-            self.text_widget.tag_remove(tag, "1.0", "end")
-
-        # Highlight Python keywords
-        import re
-        for keyword in python_keywords:
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            for match in re.finditer(pattern, content):
-                start_pos = f"1.0+{match.start()}c"
-                end_pos = f"1.0+{match.end()}c"
-                self.text_widget.tag_add("keyword", start_pos, end_pos)
-
-        # Highlight strings
-        string_pattern = r'(["\'])(?:(?=(\\?))\2.)*?\1'
-        for match in re.finditer(string_pattern, content):
-            start_pos = f"1.0+{match.start()}c"
-            end_pos = f"1.0+{match.end()}c"
-            self.text_widget.tag_add("string", start_pos, end_pos)
-
-        # Highlight comments
-        comment_pattern = r'#.*?$'
-        for match in re.finditer(comment_pattern, content, re.MULTILINE):
-            start_pos = f"1.0+{match.start()}c"
-            end_pos = f"1.0+{match.end()}c"
-            self.text_widget.tag_add("comment", start_pos, end_pos)
-
-        # Highlight numbers
-        number_pattern = r'\b\d+\.?\d*\b'
-        for match in re.finditer(number_pattern, content):
-            start_pos = f"1.0+{match.start()}c"
-            end_pos = f"1.0+{match.end()}c"
-            self.text_widget.tag_add("number", start_pos, end_pos)
+            widget.tag_remove(tag, start, end)
+
+        # Tokens never span lines, so each line is scanned on its own and
+        # matches map straight to "line.col" indices
+        ranges = {"keyword": [], "string": [], "comment": [], "number": []}
+        for line_no, line in enumerate(lines, first):
+            stripped = line.lstrip()
+            if stripped.startswith('#'):
+                # Whole-line comment: no need to run the tokenizer
+                indent = len(line) - len(stripped)
+                ranges["comment"] += (f"{line_no}.{indent}",
+                                      f"{line_no}.{len(line)}")
+                continue
+            for match in _HIGHLIGHT_RE.finditer(line):
+                ranges[match.lastgroup] += (f"{line_no}.{match.start()}",
+                                            f"{line_no}.{match.end()}")
+
+        # One tag_add per tag covers all of its ranges
+        for tag, indices in ranges.items():
+            if indices:
+                widget.tag_add(tag, *indices)
 
 
 class GradientButton(tk.Canvas):
     """Custom gradient button widget"""
 
+    # Rendered gradients, keyed by (width, height, start, end, state)
+    _IMAGE_CACHE = {}
+
     def __init__(self,
                  parent,
                  text="",
@@ -135,35 +497,39 @@ class GradientButton(tk.Canvas):
         self.width = width
         self.height = height
         self.is_pressed = False
+        self._last_state = "normal"
+        self._target_state = "normal"
+        self._redraw_job = None
 
         self.bind("<Button-1>", self.on_click)
         self.bind("<ButtonRelease-1>", self.on_release)
         self.bind("<Enter>", self.on_enter)
         self.bind("<Leave>", self.on_leave)
 
-        self.draw_gradient()
-
-    def hex_to_rgb(self, hex_color):
-        """Convert hex color to RGB tuple"""
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i + 2], 16) for i in (0, 2, 4))
+        # Canvas items are created once; redraws only swap the gradient image
+        self._grad_id = self.create_image(0, 0, anchor='nw', tags=("grad",))
 
-    def rgb_to_hex(self, rgb):
-        """Convert RGB tuple to hex color"""
-        return '#{:02x}{:02x}{:02x}'.format(int(rgb[0]), int(rgb[1]),
-                                            int(rgb[2]))
+        # Add rounded rectangle border
+        self.create_rectangle(0,
+                              0,
+                              self.width,
+                              self.height,
+                              outline="#444",
+                              width=1)
 
-    def interpolate_color(self, start_rgb, end_rgb, factor):
-        """Interpolate between two RGB colors"""
-        return tuple(start_rgb[i] + factor * (end_rgb[i] - start_rgb[i])
-                     for i in range(3))
+        # Add text
+        self._text_id = self.create_text(self.width // 2,
+                                         self.height // 2,
+                                         text=self.text,
+                                         fill=self.text_color,
+                                         font=('Segoe UI', 9, 'bold'))
 
-    def draw_gradient(self, hover=False, pressed=False):
-        """Draw the gradient background"""
-        self.delete("all")
+        self.draw_gradient()
 
-        start_rgb = self.hex_to_rgb(self.start_color)
-        end_rgb = self.hex_to_rgb(self.end_color)
+    def gradient_colors(self, hover=False, pressed=False):
+        """Compute the hex color of every gradient row"""
+        start_rgb = hex_to_rgb(self.start_color)
+        end_rgb = hex_to_rgb(self.end_color)
 
         # Adjust colors for hover/pressed states
         if pressed:
@@ -173,45 +539,64 @@ class GradientButton(tk.Canvas):
             start_rgb = tuple(min(255, c + 20) for c in start_rgb)
             end_rgb = tuple(min(255, c + 20) for c in end_rgb)
 
-        # Create gradient
-        for i in range(self.height):
-            factor = i / self.height
-            color_rgb = self.interpolate_color(start_rgb, end_rgb, factor)
-            color_hex = self.rgb_to_hex(color_rgb)
-            self.create_line(0, i, self.width, i, fill=color_hex, width=1)
+        return gradient_hex(start_rgb, end_rgb, self.height, self.height)
 
-        # Add rounded rectangle border
-        self.create_rectangle(0,
-                              0,
-                              self.width,
-                              self.height,
-                              outline="#444",
-                              width=1)
+    def draw_gradient(self, hover=False, pressed=False):
+        """Draw the gradient background"""
+        state = "pressed" if pressed else "hover" if hover else "normal"
+        key = (self.width, self.height, self.start_color, self.end_color,
+               state)
+        image = self._IMAGE_CACHE.get(key)
+        if image is None:
+            # One color per row; put() tiles the column across the width
+            colors = self.gradient_colors(hover=hover, pressed=pressed)
+            image = tk.PhotoImage(master=self,
+                                  width=self.width,
+                                  height=self.height)
+            image.put(" ".join(f"{{{color}}}" for color in colors),
+                      to=(0, 0, self.width, self.height))
+            self._IMAGE_CACHE[key] = image
+
+        self.itemconfig(self._grad_id, image=image)
+
+    def set_state(self, state):
+        """Request a visual state ("normal", "hover" or "pressed")"""
+        # Bursts of pointer events collapse into one redraw when idle
+        self._target_state = state
+        if self._redraw_job is None:
+            self._redraw_job = self.after_idle(self._do_redraw)
+
+    def _do_redraw(self):
+        self._redraw_job = None
+        state = self._target_state
+        if state == self._last_state:
+            return
+        self._last_state = state
+        self.draw_gradient(hover=state == "hover", pressed=state == "pressed")
 
-        # Add text
-        self.create_text(self.width // 2,
-                         self.height // 2,
-                         text=self.text,
-                         fill=self.text_color,
-                         font=('Segoe UI', 9, 'bold'))
+    def destroy(self):
+        if self._redraw_job is not None:
+            self.after_cancel(self._redraw_job)
+            self._redraw_job = None
+        super().destroy()
 
     def on_click(self, event):
         self.is_pressed = True
-        self.draw_gradient(pressed=True)
+        self.set_state("pressed")
 
     def on_release(self, event):
         self.is_pressed = False
-        self.draw_gradient()
+        self.set_state("normal")
         if self.command:
             self.command()
 
     def on_enter(self, event):
         if not self.is_pressed:
-            self.draw_gradient(hover=True)
+            self.set_state("hover")
 
     def on_leave(self, event):
         if not self.is_pressed:
-            self.draw_gradient()
+            self.set_state("normal")
 
 
 class RoundedGradientButton(tk.Canvas):
@@ -243,75 +628,37 @@ class RoundedGradientButton(tk.Canvas):
         self.height = height
         self.corner_radius = corner_radius
         self.is_pressed = False
+        self._last_state = "normal"
+        self._target_state = "normal"
+        self._redraw_job = None
+        self._images = {}  # Rendered gradient images per state
 
         self.bind("<Button-1>", self.on_click)
         self.bind("<ButtonRelease-1>", self.on_release)
         self.bind("<Enter>", self.on_enter)
         self.bind("<Leave>", self.on_leave)
 
-        self.draw_rounded_gradient()
-
-    def hex_to_rgb(self, hex_color):
-        """Convert hex color to RGB tuple"""
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i + 2], 16) for i in (0, 2, 4))
+        # Canvas items are created once; redraws only swap the gradient image
+        self._grad_id = self.create_image(0, 0, anchor='nw', tags=("grad",))
 
-    def rgb_to_hex(self, rgb):
-        """Convert RGB tuple to hex color"""
-        return '#{:02x}{:02x}{:02x}'.format(int(rgb[0]), int(rgb[1]),
-                                            int(rgb[2]))
+        # Add text
+        self._text_id = self.create_text(self.width // 2,
+                                         self.height // 2,
+                                         text=self.text,
+                                         fill=self.text_color,
+                                         font=('Segoe UI', 11, 'bold'))
 
-    def interpolate_color(self, start_rgb, end_rgb, factor):
-        """Interpolate between two RGB colors"""
-        return tuple(start_rgb[i] + factor * (end_rgb[i] - start_rgb[i])
-                     for i in range(3))
+        self.draw_rounded_gradient()
 
     def create_rounded_rectangle(self, x1, y1, x2, y2, radius=12, **kwargs):
         """Create a rounded rectangle on the canvas"""
-        import math
-
-        points = []
-
-        # Ensure radius doesn't exceed half of width or height
-        max_radius = min((x2 - x1) // 2, (y2 - y1) // 2)
-        radius = min(radius, max_radius)
-
-        # Top-left corner
-        for i in range(90, 181, 5):
-            angle = math.radians(i)
-            x = x1 + radius + radius * math.cos(angle)
-            y = y1 + radius + radius * math.sin(angle)
-            points.extend([x, y])
-
-        # Top-right corner
-        for i in range(0, 91, 5):
-            angle = math.radians(i)
-            x = x2 - radius + radius * math.cos(angle)
-            y = y1 + radius + radius * math.sin(angle)
-            points.extend([x, y])
-
-        # Bottom-right corner
-        for i in range(270, 361, 5):
-            angle = math.radians(i)
-            x = x2 - radius + radius * math.cos(angle)
-            y = y2 - radius + radius * math.sin(angle)
-            points.extend([x, y])
-
-        # Bottom-left corner
-        for i in range(180, 271, 5):
-            angle = math.radians(i)
-            x = x1 + radius + radius * math.cos(angle)
-            y = y2 - radius + radius * math.sin(angle)
-            points.extend([x, y])
-
+        points = rounded_rectangle_points(x1, y1, x2, y2, radius)
         return self.create_polygon(points, smooth=True, **kwargs)
 
     def draw_rounded_gradient(self, hover=False, pressed=False):
         """Draw the rounded gradient background"""
-        self.delete("all")
-
-        start_rgb = self.hex_to_rgb(self.start_color)
-        end_rgb = self.hex_to_rgb(self.end_color)
+        start_rgb = hex_to_rgb(self.start_color)
+        end_rgb = hex_to_rgb(self.end_color)
 
         # Adjust colors for hover/pressed states
         if pressed:
@@ -322,91 +669,288 @@ class RoundedGradientButton(tk.Canvas):
             end_rgb = tuple(min(255, c + 20) for c in end_rgb)
 
         # Create a proper rounded rectangle with gradient
-        self.create_rounded_rect_with_gradient(start_rgb, end_rgb)
-
-        # Add text
-        self.create_text(self.width // 2,
-                         self.height // 2,
-                         text=self.text,
-                         fill=self.text_color,
-                         font=('Segoe UI', 11, 'bold'))
+        state = "pressed" if pressed else "hover" if hover else "normal"
+        self.create_rounded_rect_with_gradient(start_rgb, end_rgb, state)
 
-    def create_rounded_rect_with_gradient(self, start_rgb, end_rgb):
+    def create_rounded_rect_with_gradient(self, start_rgb, end_rgb,
+                                          state="normal"):
         """Create a rounded rectangle with proper gradient"""
-        import math
-
-        # Calculate corner points for rounded rectangle
-        r = min(self.corner_radius, self.width // 2, self.height // 2)
-
-        # For each y position, calculate the x boundaries and draw gradient lines
-        for y in range(self.height):
-            # Calculate left and right boundaries for this y position
-            if y < r:
-                # Top corners
-                offset = math.sqrt(r * r - (r - y) *
-                                   (r - y)) if (r - y) <= r else r
-                left_x = max(0, int(r - offset))
-                right_x = min(self.width, int(self.width - r + offset))
-            elif y >= self.height - r:
-                # Bottom corners
-                offset = math.sqrt(r * r - (y - (self.height - r - 1)) *
-                                   (y - (self.height - r - 1))) if (
-                                       y - (self.height - r - 1)) <= r else r
-                left_x = max(0, int(r - offset))
-                right_x = min(self.width, int(self.width - r + offset))
-            else:
-                # Middle section - full width
-                left_x = 0
-                right_x = self.width
-
-            # Draw gradient line for this y position
-            if right_x > left_x:
-                for x in range(left_x, right_x):
-                    if self.width > 1:
-                        factor = x / (self.width - 1)
-                    else:
-                        factor = 0
-                    color_rgb = self.interpolate_color(start_rgb, end_rgb,
-                                                       factor)
-                    color_hex = self.rgb_to_hex(color_rgb)
-                    self.create_rectangle(x,
-                                          y,
-                                          x + 1,
-                                          y + 1,
-                                          fill=color_hex,
-                                          outline=color_hex)
+        # Renders are shared by every button with the same size and colors
+        image = render_rounded_gradient(self.width, self.height,
+                                        self.corner_radius, start_rgb, end_rgb)
+        self._images[state] = image
+        self.itemconfig(self._grad_id, image=image)
+
+    def set_state(self, state):
+        """Request a visual state ("normal", "hover" or "pressed")"""
+        # Bursts of pointer events collapse into one redraw when idle
+        self._target_state = state
+        if self._redraw_job is None:
+            self._redraw_job = self.after_idle(self._do_redraw)
+
+    def _do_redraw(self):
+        self._redraw_job = None
+        state = self._target_state
+        if state == self._last_state:
+            return
+        self._last_state = state
+        self.draw_rounded_gradient(hover=state == "hover", pressed=state == "pressed")
+
+    def destroy(self):
+        if self._redraw_job is not None:
+            self.after_cancel(self._redraw_job)
+            self._redraw_job = None
+        super().destroy()
 
     def on_click(self, event):
         self.is_pressed = True
-        self.draw_rounded_gradient(pressed=True)
+        self.set_state("pressed")
 
     def on_release(self, event):
         self.is_pressed = False
-        self.draw_rounded_gradient()
+        self.set_state("normal")
         if self.command:
             self.command()
 
     def on_enter(self, event):
         if not self.is_pressed:
-            self.draw_rounded_gradient(hover=True)
+            self.set_state("hover")
 
     def on_leave(self, event):
         if not self.is_pressed:
-            self.draw_rounded_gradient()
+            self.set_state("normal")
+
+
+class FileTabState:
+    """Editor state kept for every open file"""
+
+    __slots__ = ('text_widget', 'frame', 'display_name')
+
+    def __init__(self, text_widget, frame, display_name):
+        self.text_widget = text_widget
+        self.frame = frame
+        self.display_name = display_name
+
+
+class LineNumberGutter(tk.Canvas):
+    """Line number gutter that draws only the lines visible in a Text widget"""
+
+    def __init__(self, parent, text_widget, fg='#858585',
+                 font=('Consolas', 10), **kwargs):
+        super().__init__(parent, highlightthickness=0, **kwargs)
+        self.text_widget = text_widget
+        self.fg = fg
+        self.font = font
+        self._drawn = None  # (line, y) pairs currently on the canvas
+        self._redraw_job = None
+
+        self.text_widget.bind('<Configure>', self.schedule_redraw, add='+')
+
+    def schedule_redraw(self, *args):
+        """Redraw once the widget is idle"""
+        if self._redraw_job is None:
+            self._redraw_job = self.after_idle(self.redraw)
+
+    def redraw(self):
+        """Draw a number beside every visible line of the text widget"""
+        self._redraw_job = None
+        text = self.text_widget
+        first = int(text.index("@0,0").split('.')[0])
+        last = int(text.index(f"@0,{text.winfo_height()}").split('.')[0])
+
+        # Place numbers at the editor's own line positions
+        visible = []
+        for line in range(first, last + 1):
+            info = text.dlineinfo(f"{line}.0")
+            if info is not None:
+                visible.append((line, info[1]))
+
+        # Typing within a line leaves the gutter unchanged
+        if visible == self._drawn:
+            return
+        self._drawn = visible
+
+        self.delete("all")
+        for line, y in visible:
+            self.create_text(5, y, anchor='nw', text=str(line),
+                             fill=self.fg, font=self.font)
+
+    def destroy(self):
+        if self._redraw_job is not None:
+            self.after_cancel(self._redraw_job)
+            self._redraw_job = None
+        super().destroy()
+
+
+# New project files, filled in with str.format_map
+_GAME_PY_TEMPLATE = '''"""
+{name} - Axarion Engine Game
+
+This is the main entry point for your Axarion Engine game.
+Import your assets and start building your game here!
+"""
+
+# Simple engine import - works with standalone Axarion Engine Editor
+from engine import AxarionEngine, GameObject, Scene
+import pygame
+
+class {class_name}Game:
+    def __init__(self):
+        # Initialize the Axarion Engine
+        self.engine = AxarionEngine(1280, 720, "{name}")
+
+        # Initialize pygame
+        pygame.init()
+
+        # Initialize engine
+        if not self.engine.initialize():
+            print("Warning: Engine initialization had issues, but continuing...")
+
+        # Create main scene
+        self.main_scene = self.engine.create_scene("MainScene")
+        self.engine.current_scene = self.main_scene
+
+        # Setup game objects
+        self.setup_game()
+
+    def setup_game(self):
+        """Setup your game objects here"""
+        # Example: Create a player object
+        player = GameObject("Player", "rectangle")
+        player.position = (640, 360)  # Center of screen
+        player.set_property("width", 50)
+        player.set_property("height", 50)
+        player.set_property("color", (100, 200, 255))  # Light blue
+        player.is_static = True
+
+        # Add player to scene
+        self.main_scene.add_object(player)
+
+        # Store reference for movement
+        self.player = player
+
+    def run(self):
+        """Main game loop"""
+        clock = pygame.time.Clock()
+        speed = 300  # pixels per second
+
+        while self.engine.running:
+            delta_time = clock.tick(60) / 1000.0  # Convert to seconds
+
+            # Handle events
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.engine.stop()
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        self.engine.stop()
+
+            # Handle input for player movement
+            keys = pygame.key.get_pressed()
+            x, y = self.player.position
+
+            if keys[pygame.K_w] or keys[pygame.K_UP]:
+                self.player.position = (x, y - speed * delta_time)
+            if keys[pygame.K_s] or keys[pygame.K_DOWN]:
+                self.player.position = (x, y + speed * delta_time)
+            if keys[pygame.K_a] or keys[pygame.K_LEFT]:
+                self.player.position = (x - speed * delta_time, y)
+            if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
+                self.player.position = (x + speed * delta_time, y)
+
+            # Update game
+            if self.engine.current_scene:
+                self.engine.current_scene.update(delta_time)
+
+            # Render game
+            if self.engine.renderer:
+                self.engine.renderer.clear()
+                if self.engine.current_scene:
+                    self.engine.current_scene.render(self.engine.renderer)
+                self.engine.renderer.present()
+
+        # Cleanup
+        self.engine.cleanup()
+
+if __name__ == "__main__":
+    game = {class_name}Game()
+    game.run()
+'''
+
+_README_TEMPLATE = '''# {name}
+
+Created with Axarion Engine
+
+## How to Run
+1. Open this project in Axarion Engine Editor
+2. Run `game.py` to start the game
+3. Use WASD or arrow keys to move the player
+
+## Project Structure
+- `game.py` - Main game entry point
+- Add your assets using the Asset Manager
+- Import assets in your code using the copied paths
+
+## Getting Started
+1. Use the Asset Manager to import sprites, sounds, and other assets
+2. Right-click assets to copy their paths for use in code
+3. Check the Axarion Engine documentation for more features
+
+Happy game development!
+'''
 
 
 class AxarionStudio:
 
+    # Welcome-tab logo, decoded and resized once per process
+    _LOGO_CACHE = None
+
+    # About-dialog logo, decoded and resized once per process
+    _ABOUT_LOGO_CACHE = None
+
+    # File types shown when browsing the Projects folder
+    _TREE_FILE_TYPES = frozenset({'.py', '.txt', '.md', '.json', '.yml', '.yaml'})
+
+    # Entries inserted per directory before a "... (N more)" node
+    TREE_PAGE_SIZE = 50
+
+    # Replace All patches matches one by one up to this many, then swaps
+    # the whole buffer at once
+    REPLACE_IN_PLACE_LIMIT = 1000
+
+    # File dialog filters
+    _OPEN_FILETYPES = (("Python files", "*.py"), ("Text files", "*.txt"),
+                       ("Markdown files", "*.md"), ("JSON files", "*.json"),
+                       ("All files", "*.*"))
+    _SAVE_FILETYPES = (("Python files", "*.py"), ("Text files", "*.txt"),
+                       ("All files", "*.*"))
+
     def __init__(self):
         self.root = tk.Tk()
         self.root.withdraw()  # Hide main window initially
+        # Screen size, read once for centering dialogs
+        self.screen_width = self.root.winfo_screenwidth()
+        self.screen_height = self.root.winfo_screenheight()
         
         # Initialize variables
         self.current_file = None
+        self.current_text_widget = None  # Text widget of the selected tab
         self.file_contents = {}
         self.asset_manager_window = None
         self.current_project_path = None
+        self.project_display_name = None
         self.unsaved_files = set()  # Track files with unsaved changes
+        self.unsaved_dialog = None  # Built on first use, hidden on cancel
+        self.about_dialog = None  # Built on first use, hidden on close
+        self.build_dialog = None  # Built on first use, hidden on close
+        self.build_progress_text = None
+        self.title_dirty = False
+        self.pending_status = None
+        self.child_processes = []  # Popen objects started by the editor
+        self.widget_to_file = {}  # Tab frame path -> file path
+        self.tab_font = tkfont.nametofont("TkDefaultFont")
+        self.tab_label_widths = {}  # Tab label -> measured width in pixels
+        self.tree_more_entries = {}  # "More" tree node -> (parent, entries left)
         
         # Show splash screen first if available
         if SPLASH_AVAILABLE:
@@ -553,7 +1097,8 @@ class AxarionStudio:
     def create_file_buttons(self, parent):
         """Create file operation buttons"""
         buttons = [("New File", self.new_file), ("Open File", self.open_file),
-                   ("Save", self.save_file), ("Save As", self.save_as_file)]
+                   ("Save", self.save_file), ("Save As", self.save_as_file),
+                   ("Close All", self.close_all_tabs)]
 
         for text, command in buttons:
             btn = GradientButton(parent,
@@ -669,6 +1214,7 @@ class AxarionStudio:
                                fg='white',
                                font=('Segoe UI', 9, 'bold'))
         title_label.pack(pady=5)
+        self.explorer_title_label = title_label
 
         # File tree
         tree_frame = tk.Frame(explorer_frame, bg='#0C0F2E')
@@ -681,6 +1227,7 @@ class AxarionStudio:
 
         # Bind double-click to open file
         self.file_tree.bind('<Double-1>', self.on_file_double_click)
+        self.file_tree.bind('<<TreeviewOpen>>', self.expand_tree_node)
 
         self.paned_window.add(explorer_frame)
 
@@ -692,6 +1239,11 @@ class AxarionStudio:
         self.editor_notebook = ttk.Notebook(editor_frame)
         self.editor_notebook.pack(fill=tk.BOTH, expand=True)
 
+        # Bind tab close functionality
+        self.editor_notebook.bind("<Button-1>", self.on_tab_click)
+        self.editor_notebook.bind("<<NotebookTabChanged>>",
+                                  self.on_editor_tab_changed)
+
         # Configure editor notebook style
         self.style.configure('Editor.TNotebook', background='#0C0F2E')
         self.style.configure('Editor.TNotebook.Tab',
@@ -717,55 +1269,18 @@ class AxarionStudio:
 
         # Logo instead of welcome text
         try:
-            # Check multiple locations for logo (for bundled app)
-            logo_paths = [
-                "Logo.png",  # Current directory
-                "assets/Logo.png",  # Bundled assets
-                os.path.join(os.path.dirname(__file__),
-                             "Logo.png"),  # Script directory
-                os.path.join(os.path.dirname(__file__), "assets",
-                             "Logo.png")  # Script assets
-            ]
-
-            logo_found = False
-            for logo_path in logo_paths:
-                if os.path.exists(logo_path):
-                    # Use PIL to resize logo if available
-                    if PIL_AVAILABLE:
-                        from PIL import Image, ImageTk
-                        logo_pil = Image.open(logo_path)
-                        # Resize logo to larger size (max width 450px, maintain aspect ratio)
-                        logo_pil.thumbnail((450, 225),
-                                           Image.Resampling.LANCZOS)
-                        logo_image = ImageTk.PhotoImage(logo_pil)
-                        logo_label = tk.Label(content_frame,
-                                              image=logo_image,
-                                              bg='#0C0F2E')
-                        logo_label.image = logo_image  # Keep reference
-                        logo_label.pack(pady=(80, 30))
-                        logo_found = True
-                        break
-                    else:
-                        # Fallback without PIL - try to use original but with smaller padding
-                        logo_image = tk.PhotoImage(file=logo_path)
-                        # Keep original size or slightly reduce if too large
-                        # Check if image is very large and subsample only if needed
-                        if logo_image.width() > 600 or logo_image.height(
-                        ) > 300:
-                            logo_image = logo_image.subsample(2, 2)
-                        elif logo_image.width() > 450 or logo_image.height(
-                        ) > 225:
-                            logo_image = logo_image.subsample(
-                                1, 1)  # Keep original size
-                        logo_label = tk.Label(content_frame,
-                                              image=logo_image,
-                                              bg='#0C0F2E')
-                        logo_label.image = logo_image  # Keep reference
-                        logo_label.pack(pady=(80, 30))
-                        logo_found = True
-                        break
-
-            if not logo_found:
+            # The resized logo is shared by every welcome tab
+            if AxarionStudio._LOGO_CACHE is None:
+                AxarionStudio._LOGO_CACHE = self.load_welcome_logo()
+            logo_image = AxarionStudio._LOGO_CACHE
+
+            if logo_image is not None:
+                logo_label = tk.Label(content_frame,
+                                      image=logo_image,
+                                      bg='#0C0F2E')
+                logo_label.image = logo_image  # Keep reference
+                logo_label.pack(pady=(80, 30))
+            else:
                 # Fallback to text if logo not found
                 welcome_label = tk.Label(
                     content_frame,
@@ -884,23 +1399,59 @@ class AxarionStudio:
 
         self.editor_notebook.add(welcome_frame, text="Welcome  ✕")
 
+    def load_welcome_logo(self):
+        """Load the welcome-tab logo, or return None if it can't be found"""
+        logo_path = find_asset("Logo.png")
+        if logo_path is None:
+            return None
+
+        # Use PIL to resize logo if available
+        pil = get_pil()
+        if pil:
+            Image, ImageTk = pil
+            logo_pil = Image.open(logo_path)
+            # Resize logo to larger size (max width 450px, maintain aspect ratio)
+            logo_pil.thumbnail((450, 225), Image.Resampling.LANCZOS)
+            return ImageTk.PhotoImage(logo_pil)
+
+        # Fallback without PIL - keep original size unless it is very large
+        logo_image = tk.PhotoImage(file=logo_path)
+        if logo_image.width() > 600 or logo_image.height() > 300:
+            logo_image = logo_image.subsample(2, 2)
+        return logo_image
+
+    def load_about_logo(self):
+        """Load the About-dialog logo, or return None if it can't be found"""
+        logo_path = find_asset("Logo.png")
+        if logo_path is None:
+            return None
+
+        pil = get_pil()
+        if pil:
+            Image, ImageTk = pil
+            logo_pil = Image.open(logo_path)
+            logo_pil.thumbnail((200, 100), Image.Resampling.LANCZOS)
+            return ImageTk.PhotoImage(logo_pil)
+
+        return tk.PhotoImage(file=logo_path).subsample(2, 2)
+
+    def center_dialog(self, dialog, width, height):
+        """Size and center a dialog on screen in a single geometry call"""
+        x = (self.screen_width - width) // 2
+        y = (self.screen_height - height) // 2
+        dialog.geometry(f"{width}x{height}+{x}+{y}")
+
     def create_new_project(self):
         """Create a new Axarion game project"""
         # Create dialog for project name
         dialog = tk.Toplevel(self.root)
         dialog.title("Create New Project")
-        dialog.geometry("400x250")
+        self.center_dialog(dialog, 400, 250)
         dialog.configure(bg='#0C0F2E')
         dialog.resizable(False, False)
         dialog.transient(self.root)
         dialog.grab_set()
 
-        # Center dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (dialog.winfo_width() // 2)
-        y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() // 2)
-        dialog.geometry(f'+{x}+{y}')
-
         # Dialog content
         title_label = tk.Label(dialog,
                                text="Create New Axarion Project",
@@ -940,8 +1491,7 @@ class AxarionStudio:
                 return
 
             if self.create_project_folder(project_name):
-                self.current_project_path = str(
-                    Path("Projects") / project_name)
+                self.set_project_path(str(Path("Projects") / project_name))
                 dialog.destroy()
                 self.load_project_files()
                 messagebox.showinfo(
@@ -990,132 +1540,15 @@ class AxarionStudio:
 
             project_dir.mkdir(exist_ok=True)
 
-            # Create game.py with basic template
-            game_py_content = f'''"""
-{project_name} - Axarion Engine Game
-
-This is the main entry point for your Axarion Engine game.
-Import your assets and start building your game here!
-"""
-
-# Simple engine import - works with standalone Axarion Engine Editor
-from engine import AxarionEngine, GameObject, Scene
-import pygame
-
-class {project_name.replace(' ', '')}Game:
-    def __init__(self):
-        # Initialize the Axarion Engine
-        self.engine = AxarionEngine(1280, 720, "{project_name}")
-
-        # Initialize pygame
-        pygame.init()
-
-        # Initialize engine
-        if not self.engine.initialize():
-            print("Warning: Engine initialization had issues, but continuing...")
-
-        # Create main scene
-        self.main_scene = self.engine.create_scene("MainScene")
-        self.engine.current_scene = self.main_scene
-
-        # Setup game objects
-        self.setup_game()
-
-    def setup_game(self):
-        """Setup your game objects here"""
-        # Example: Create a player object
-        player = GameObject("Player", "rectangle")
-        player.position = (640, 360)  # Center of screen
-        player.set_property("width", 50)
-        player.set_property("height", 50)
-        player.set_property("color", (100, 200, 255))  # Light blue
-        player.is_static = True
-
-        # Add player to scene
-        self.main_scene.add_object(player)
-
-        # Store reference for movement
-        self.player = player
-
-    def run(self):
-        """Main game loop"""
-        clock = pygame.time.Clock()
-        speed = 300  # pixels per second
-
-        while self.engine.running:
-            delta_time = clock.tick(60) / 1000.0  # Convert to seconds
-
-            # Handle events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.engine.stop()
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        self.engine.stop()
-
-            # Handle input for player movement
-            keys = pygame.key.get_pressed()
-            x, y = self.player.position
-
-            if keys[pygame.K_w] or keys[pygame.K_UP]:
-                self.player.position = (x, y - speed * delta_time)
-            if keys[pygame.K_s] or keys[pygame.K_DOWN]:
-                self.player.position = (x, y + speed * delta_time)
-            if keys[pygame.K_a] or keys[pygame.K_LEFT]:
-                self.player.position = (x - speed * delta_time, y)
-            if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-                self.player.position = (x + speed * delta_time, y)
-
-            # Update game
-            if self.engine.current_scene:
-                self.engine.current_scene.update(delta_time)
-
-            # Render game
-            if self.engine.renderer:
-                self.engine.renderer.clear()
-                if self.engine.current_scene:
-                    self.engine.current_scene.render(self.engine.renderer)
-                self.engine.renderer.present()
-
-        # Cleanup
-        self.engine.cleanup()
-
-if __name__ == "__main__":
-    game = {project_name.replace(' ', '')}Game()
-    game.run()
-'''
-
-            # Write game.py file
-            game_py_path = project_dir / "game.py"
-            with open(game_py_path, 'w', encoding='utf-8') as f:
-                f.write(game_py_content)
-
-            # Create README.md
-            readme_content = f'''# {project_name}
-
-Created with Axarion Engine
-
-## How to Run
-1. Open this project in Axarion Engine Editor
-2. Run `game.py` to start the game
-3. Use WASD or arrow keys to move the player
-
-## Project Structure
-- `game.py` - Main game entry point
-- Add your assets using the Asset Manager
-- Import assets in your code using the copied paths
-
-## Getting Started
-1. Use the Asset Manager to import sprites, sounds, and other assets
-2. Right-click assets to copy their paths for use in code
-3. Check the Axarion Engine documentation for more features
-
-Happy game development!
-'''
-
-            readme_path = project_dir / "README.md"
-            with open(readme_path, 'w', encoding='utf-8') as f:
-                f.write(readme_content)
+            # Fill in the project templates
+            fields = {
+                'name': project_name,
+                'class_name': project_name.replace(' ', '')
+            }
+            (project_dir / "game.py").write_text(
+                _GAME_PY_TEMPLATE.format_map(fields), encoding='utf-8')
+            (project_dir / "README.md").write_text(
+                _README_TEMPLATE.format_map(fields), encoding='utf-8')
 
             return True
 
@@ -1139,7 +1572,7 @@ Happy game development!
             # Check if it's a valid project (contains game.py)
             game_py_path = Path(project_dir) / "game.py"
             if game_py_path.exists():
-                self.current_project_path = project_dir
+                self.set_project_path(project_dir)
                 self.open_file_in_editor(str(game_py_path))
                 self.load_project_files()
                 messagebox.showinfo(
@@ -1152,8 +1585,7 @@ Happy game development!
 
     def close_project(self):
         """Close the current project and return to workspace view"""
-        self.current_project_path = None
-        self.unsaved_files.clear()  # Clear unsaved files tracking
+        self.set_project_path(None)
         self.load_project_files()
         self.update_window_title()  # Update title to remove project name
 
@@ -1176,34 +1608,22 @@ Happy game development!
 
     def load_project_files(self):
         """Load project files into the file tree (simplified for project-only view)"""
-        # Clear existing items
-        for item in self.file_tree.get_children():
-            self.file_tree.delete(item)
+        # Clear existing items in one call
+        children = self.file_tree.get_children()
+        if children:
+            self.file_tree.delete(*children)
+        self.tree_more_entries.clear()
 
         # Update title based on current state
-        if hasattr(self, 'paned_window'):
-            for widget in self.paned_window.panes():
-                frame = self.paned_window.nametowidget(widget)
-                if hasattr(frame, 'winfo_children'):
-                    for child in frame.winfo_children():
-                        if isinstance(child,
-                                      tk.Frame) and child.winfo_children():
-                            title_frame = child.winfo_children()[0]
-                            if isinstance(
-                                    title_frame,
-                                    tk.Frame) and title_frame.winfo_children():
-                                title_label = title_frame.winfo_children()[0]
-                                if isinstance(title_label, tk.Label):
-                                    title_text = "PROJECT" if self.current_project_path else "WORKSPACE"
-                                    title_label.configure(text=title_text)
-                                    break
+        if hasattr(self, 'explorer_title_label'):
+            title_text = "PROJECT" if self.current_project_path else "WORKSPACE"
+            self.explorer_title_label.configure(text=title_text)
 
         # If we have a current project, show only its files
         if self.current_project_path and os.path.exists(
                 self.current_project_path):
-            project_name = os.path.basename(self.current_project_path)
             self.add_project_files_only("", self.current_project_path,
-                                        project_name)
+                                        self.project_display_name)
         else:
             # Show just the Projects folder for project creation
             projects_dir = Path("Projects")
@@ -1230,43 +1650,8 @@ Happy game development!
                                                  values=[path],
                                                  open=True)
 
-            # Add only relevant files in the project directory
-            try:
-                items = sorted(os.listdir(path))
-                for item in items:
-                    item_path = os.path.join(path, item)
-                    if os.path.isfile(item_path):
-                        # Show all files in project directory
-                        self.file_tree.insert(project_node,
-                                              'end',
-                                              text=item,
-                                              values=[item_path])
-                    elif os.path.isdir(item_path) and not item.startswith('.'):
-                        # Show subdirectories but don't expand them deeply
-                        sub_node = self.file_tree.insert(project_node,
-                                                         'end',
-                                                         text=item,
-                                                         values=[item_path],
-                                                         open=False)
-                        # Add just one level of files in subdirectories
-                        try:
-                            sub_items = os.listdir(
-                                item_path)[:10]  # Limit to first 10 items
-                            for sub_item in sub_items:
-                                if os.path.isfile(
-                                        os.path.join(item_path, sub_item)):
-                                    self.file_tree.insert(sub_node,
-                                                          'end',
-                                                          text=sub_item,
-                                                          values=[
-                                                              os.path.join(
-                                                                  item_path,
-                                                                  sub_item)
-                                                          ])
-                        except PermissionError:
-                            pass
-            except PermissionError:
-                pass
+            # Subdirectories are filled in when expanded
+            self.populate_tree_node(project_node, path, show_all=True)
 
         except Exception as e:
             print(f"Error loading project directory {path}: {e}")
@@ -1280,28 +1665,80 @@ Happy game development!
                                              text=name,
                                              values=[path],
                                              open=True)
+            self.populate_tree_node(dir_node, path)
+        except Exception as e:
+            print(f"Error loading directory {path}: {e}")
 
-            # Add files and subdirectories
-            try:
-                items = sorted(os.listdir(path))
-                for item in items:
-                    if item.startswith('.'):
-                        continue
-
-                    item_path = os.path.join(path, item)
-                    if os.path.isdir(item_path):
-                        self.add_directory_to_tree(dir_node, item_path, item)
-                    else:
-                        # Only show relevant file types
-                        if item.endswith(
-                            ('.py', '.txt', '.md', '.json', '.yml', '.yaml')):
-                            self.file_tree.insert(dir_node,
-                                                  'end',
-                                                  text=item,
-                                                  values=[item_path])
-            except PermissionError:
-                pass
+    def populate_tree_node(self, dir_node, path, show_all=False):
+        """Add one level of a directory; subdirectories load when opened"""
+        try:
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except PermissionError:
+            return
+
+        visible = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if not entry.name.startswith('.'):
+                    visible.append((entry, True))
+            elif show_all:
+                # Show all files in project directory
+                if entry.is_file():
+                    visible.append((entry, False))
+            elif (not entry.name.startswith('.') and
+                  os.path.splitext(entry.name)[1] in self._TREE_FILE_TYPES):
+                # Only show relevant file types
+                visible.append((entry, False))
+
+        self.insert_tree_entries(dir_node, visible)
+
+    def insert_tree_entries(self, dir_node, entries):
+        """Insert a page of entries, leaving a 'more' node for the rest"""
+        page = self.TREE_PAGE_SIZE
+        for entry, is_dir in entries[:page]:
+            node = self.file_tree.insert(dir_node,
+                                         'end',
+                                         text=entry.name,
+                                         values=[entry.path],
+                                         open=False)
+            if is_dir:
+                # Placeholder child so the node can be expanded
+                self.file_tree.insert(node,
+                                      'end',
+                                      text='...',
+                                      values=['__lazy__'])
+
+        remaining = entries[page:]
+        if remaining:
+            more_node = self.file_tree.insert(
+                dir_node,
+                'end',
+                text=f'... ({len(remaining)} more)',
+                values=['__more__'])
+            self.tree_more_entries[more_node] = (dir_node, remaining)
+
+    def expand_tree_node(self, event=None):
+        """Load the contents of an opened directory or the next page"""
+        item = self.file_tree.focus()
+
+        if item in self.tree_more_entries:
+            dir_node, remaining = self.tree_more_entries.pop(item)
+            self.file_tree.delete(item)
+            self.insert_tree_entries(dir_node, remaining)
+            return
+
+        children = self.file_tree.get_children(item)
+        if (len(children) != 1 or
+                self.file_tree.item(children[0], 'values') != ('__lazy__',)):
+            return
 
+        self.file_tree.delete(children[0])
+        path = self.file_tree.item(item, 'values')[0]
+        try:
+            self.populate_tree_node(item,
+                                    path,
+                                    show_all=bool(self.current_project_path))
         except Exception as e:
             print(f"Error loading directory {path}: {e}")
 
@@ -1317,11 +1754,39 @@ Happy game development!
                     self.open_file_in_editor(file_path)
 
     def open_file_in_editor(self, file_path):
-        """Open file in a new editor tab"""
+        """Open file in a new editor tab, or select its existing tab"""
+        if self.select_open_file(file_path):
+            return
+        # Read and decode off the Tk thread; the tab is built once done
+        threading.Thread(target=self.read_file_for_editor,
+                         args=(file_path, ),
+                         daemon=True).start()
+
+    def read_file_for_editor(self, file_path):
+        """Read a file in the background and hand it to the Tk thread"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
+            content = Path(file_path).read_text(encoding='utf-8')
+        except Exception as e:
+            self.root.after(0, messagebox.showerror, "Error",
+                            f"Could not open file: {e}")
+            return
+        self.root.after(0, self.finish_open_file, file_path, content)
 
+    def select_open_file(self, file_path):
+        """Select the tab already showing file_path; False if none"""
+        state = self.file_contents.get(file_path)
+        if state is None:
+            return False
+        self.editor_notebook.select(state.frame)
+        self.update_status(f"Opened: {state.display_name}")
+        return True
+
+    def finish_open_file(self, file_path, content):
+        """Create the editor tab for a file that has been read"""
+        # Another read of the same file may have finished first
+        if self.select_open_file(file_path):
+            return
+        try:
             # Create new tab
             editor_frame = tk.Frame(self.editor_notebook, bg='#1e1e1e')
 
@@ -1334,16 +1799,6 @@ Happy game development!
             line_frame.pack(side=tk.LEFT, fill=tk.Y)
             line_frame.pack_propagate(False)
 
-            line_text = tk.Text(line_frame,
-                                width=4,
-                                bg='#2d2d2d',
-                                fg='#858585',
-                                font=('Consolas', 10),
-                                state='disabled',
-                                wrap='none',
-                                cursor='arrow')
-            line_text.pack(fill=tk.BOTH, expand=True)
-
             # Main text editor
             text_editor = tk.Text(text_frame,
                                   bg='#1e1e1e',
@@ -1356,6 +1811,12 @@ Happy game development!
                                   selectbackground='#264F78')
             text_editor.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
+            line_numbers = LineNumberGutter(line_frame,
+                                            text_editor,
+                                            bg='#2d2d2d',
+                                            cursor='arrow')
+            line_numbers.pack(fill=tk.BOTH, expand=True)
+
             # Scrollbars - dark theme compatible
             v_scrollbar = tk.Scrollbar(text_frame,
                                        orient='vertical',
@@ -1368,15 +1829,6 @@ Happy game development!
                                        bd=0,
                                        width=12)
             v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-            text_editor.config(yscrollcommand=v_scrollbar.set)
-
-            # Configure scrollbar style safely
-            try:
-                v_scrollbar.configure(bg='#2d2d2d',
-                                      activebackground='#404040',
-                                      troughcolor='#1e1e1e')
-            except:
-                pass
 
             h_scrollbar = tk.Scrollbar(editor_frame,
                                        orient='horizontal',
@@ -1391,51 +1843,42 @@ Happy game development!
             h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
             text_editor.config(xscrollcommand=h_scrollbar.set)
 
-            # Configure scrollbar style safely
-            try:
-                h_scrollbar.configure(bg='#2d2d2d',
-                                      activebackground='#404040',
-                                      troughcolor='#1e1e1e')
-            except:
-                pass
-
             # Insert content
-            text_editor.insert('1.0', content)
+            self.insert_text_chunked(text_editor, content,
+                                     line_numbers.schedule_redraw)
 
             # Setup syntax highlighting
             highlighter = SyntaxHighlighter(text_editor)
-            text_editor.bind('<KeyRelease>', highlighter.highlight_syntax)
-            text_editor.bind('<Button-1>', highlighter.highlight_syntax)
             highlighter.highlight_syntax()
 
-            # Track file modifications
+            # Highlight and number lines as they scroll into view
+            def on_yscroll(first, last):
+                v_scrollbar.set(first, last)
+                highlighter.schedule_viewport()
+                line_numbers.schedule_redraw()
+
+            text_editor.config(yscrollcommand=on_yscroll)
+
+            # Track file modifications; the cheap bookkeeping runs at once,
+            # highlighting waits until typing pauses
             def on_text_change(event=None):
+                if event is not None and event.keysym in NAVIGATION_KEYS:
+                    # Cursor movement and modifiers never change the text
+                    return
+                if self.buffer_is_loading(text_editor):
+                    return
                 self.mark_file_modified(file_path)
-                self.update_line_numbers(text_editor, line_text)
+                line_numbers.schedule_redraw()
+                highlighter.schedule_highlight(event)
 
-            # Update line numbers and track changes
-            self.update_line_numbers(text_editor, line_text)
+            # Track changes; line numbers follow scrolling via yscrollcommand
             text_editor.bind('<KeyRelease>', on_text_change)
-            text_editor.bind(
-                '<Button-1>',
-                lambda e: self.update_line_numbers(text_editor, line_text))
-
-            # Bind scroll events to synchronize line numbers
-            def sync_line_numbers(*args):
-                line_text.yview_moveto(text_editor.yview()[0])
-
-            def on_scroll(*args):
-                text_editor.yview(*args)
-                sync_line_numbers()
 
             def on_mousewheel(event):
                 text_editor.yview_scroll(int(-1 * (event.delta / 120)),
                                          "units")
-                sync_line_numbers()
                 return "break"
 
-            # Configure scrollbar to sync line numbers
-            v_scrollbar.config(command=on_scroll)
             text_editor.bind('<MouseWheel>', on_mousewheel)
             text_editor.bind(
                 '<Button-4>', lambda e:
@@ -1449,156 +1892,176 @@ Happy game development!
             # Add tab with close button
             filename = os.path.basename(file_path)
             tab_text = f"{filename}  ✕"
+            editor_frame.text_widget = text_editor
+            self.widget_to_file[str(editor_frame)] = file_path
+            editor_frame.bind('<Destroy>', self.on_editor_frame_destroyed)
             self.editor_notebook.add(editor_frame, text=tab_text)
             self.editor_notebook.select(editor_frame)
 
-            # Bind tab close functionality
-            self.editor_notebook.bind("<Button-1>", self.on_tab_click)
-
             # Store file info
-            self.file_contents[file_path] = {
-                'text_widget': text_editor,
-                'original_content': content,
-                'modified': False
-            }
+            self.file_contents[file_path] = FileTabState(
+                text_editor, editor_frame, filename)
 
-            self.current_file = file_path
+            self.on_editor_tab_changed()
             self.update_status(f"Opened: {filename}")
 
         except Exception as e:
             messagebox.showerror("Error", f"Could not open file: {e}")
 
-    def update_line_numbers(self, text_widget, line_widget):
-        """Update line numbers display"""
-        line_widget.config(state='normal')
-        line_widget.delete('1.0', 'end')
+    def insert_text_chunked(self, text_widget, content, on_done=None):
+        """Insert text, splitting files over 1 MB so the window can repaint"""
+        chunk_size = 64 * 1024
+        if len(content) <= 1024 * 1024:
+            chunk_size = len(content) or 1
 
-        # Get number of lines
-        lines = int(text_widget.index('end-1c').split('.')[0])
+        def insert_next(offset):
+            if not text_widget.winfo_exists():
+                return
+            text_widget.configure(state=tk.NORMAL)
+            text_widget.insert('end-1c', content[offset:offset + chunk_size])
+            offset += chunk_size
+            if offset < len(content):
+                # Read-only until the whole file is in, so nothing can be
+                # typed or saved against a partial buffer
+                text_widget.configure(state=tk.DISABLED)
+                self.root.after(1, insert_next, offset)
+            else:
+                # Loading the file shouldn't be undoable or count as an edit
+                text_widget.edit_reset()
+                text_widget.edit_modified(False)
+                if on_done:
+                    on_done()
 
-        # Add line numbers
-        line_numbers = '\n'.join(str(i) for i in range(1, lines + 1))
-        line_widget.insert('1.0', line_numbers)
-        line_widget.config(state='disabled')
+        insert_next(0)
 
-        # Synchronize scrolling
-        line_widget.yview_moveto(text_widget.yview()[0])
+    def buffer_is_loading(self, text_widget):
+        """True while insert_text_chunked is still filling text_widget"""
+        return str(text_widget.cget('state')) == tk.DISABLED
 
     def update_status(self, message):
-        """Update status bar message"""
+        """Update status bar message, at most once every 50 ms"""
+        if self.pending_status is None:
+            # Held keys such as Enter in Replace repeat faster than idle
+            # ticks, so a short delay coalesces them too
+            self.root.after(50, self.flush_status)
+        self.pending_status = message
+
+    def flush_status(self):
+        """Show the latest status message"""
+        message, self.pending_status = self.pending_status, None
         self.status_bar.config(text=message)
 
     def on_closing(self):
         """Handle window closing event with unsaved work check"""
         if self.has_unsaved_work():
-            # Create confirmation dialog
-            dialog = tk.Toplevel(self.root)
-            dialog.title("Unsaved Changes")
-            dialog.geometry("400x200")
-            dialog.configure(bg='#0C0F2E')
-            dialog.resizable(False, False)
-            dialog.transient(self.root)
+            # Reuse the confirmation dialog after the first time
+            dialog = self.unsaved_dialog
+            if dialog is None:
+                dialog = self.unsaved_dialog = self.create_unsaved_dialog()
+            else:
+                dialog.deiconify()
             dialog.grab_set()
+            dialog.focus()
+        else:
+            # No unsaved work, quit immediately
+            self.root.destroy()
 
-            # Center dialog
-            dialog.update_idletasks()
-            x = (dialog.winfo_screenwidth() // 2) - (dialog.winfo_width() // 2)
-            y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() //
-                                                      2)
-            dialog.geometry(f'+{x}+{y}')
+    def create_unsaved_dialog(self):
+        """Create the unsaved changes dialog; Cancel hides it for reuse"""
+        # Create confirmation dialog
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Unsaved Changes")
+        self.center_dialog(dialog, 400, 200)
+        dialog.configure(bg='#0C0F2E')
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
 
-            # Warning icon and message
-            warning_frame = tk.Frame(dialog, bg='#0C0F2E')
-            warning_frame.pack(pady=20)
+        # Warning icon and message
+        warning_frame = tk.Frame(dialog, bg='#0C0F2E')
+        warning_frame.pack(pady=20)
 
-            title_label = tk.Label(warning_frame,
-                                   text="⚠️ Unsaved Changes",
-                                   font=('Segoe UI', 14, 'bold'),
-                                   bg='#0C0F2E',
-                                   fg='#FFD700')
-            title_label.pack(pady=(0, 10))
-
-            message_label = tk.Label(
-                warning_frame,
-                text=
-                "You have unsaved changes in your project.\nDo you want to quit without saving?",
-                font=('Segoe UI', 10),
-                bg='#0C0F2E',
-                fg='white',
-                justify=tk.CENTER)
-            message_label.pack()
+        title_label = tk.Label(warning_frame,
+                               text="⚠️ Unsaved Changes",
+                               font=('Segoe UI', 14, 'bold'),
+                               bg='#0C0F2E',
+                               fg='#FFD700')
+        title_label.pack(pady=(0, 10))
 
-            # Buttons
-            button_frame = tk.Frame(dialog, bg='#0C0F2E')
-            button_frame.pack(pady=20)
+        message_label = tk.Label(
+            warning_frame,
+            text=
+            "You have unsaved changes in your project.\nDo you want to quit without saving?",
+            font=('Segoe UI', 10),
+            bg='#0C0F2E',
+            fg='white',
+            justify=tk.CENTER)
+        message_label.pack()
 
-            def save_and_quit():
-                self.save_all_files()
-                dialog.destroy()
-                self.root.destroy()
+        # Buttons
+        button_frame = tk.Frame(dialog, bg='#0C0F2E')
+        button_frame.pack(pady=20)
 
-            def quit_without_saving():
-                dialog.destroy()
+        def save_and_quit():
+            if self.save_all_files():
                 self.root.destroy()
+                return
+            # Keep the editor open so the unsaved work isn't lost
+            dialog.grab_release()
+            dialog.withdraw()
+            messagebox.showerror(
+                "Error", "Some files could not be saved; the editor stays open")
 
-            def cancel_quit():
-                dialog.destroy()
-
-            # Save and quit button
-            save_btn = GradientButton(button_frame,
-                                      text="Save & Quit",
-                                      command=save_and_quit,
-                                      width=100,
-                                      height=30,
-                                      start_color='#22C55E',
-                                      end_color='#16A34A')
-            save_btn.pack(side=tk.LEFT, padx=(0, 10))
-
-            # Quit without saving button
-            quit_btn = GradientButton(button_frame,
-                                      text="Quit",
-                                      command=quit_without_saving,
-                                      width=70,
-                                      height=30,
-                                      start_color='#EF4444',
-                                      end_color='#DC2626')
-            quit_btn.pack(side=tk.LEFT, padx=(0, 10))
-
-            # Cancel button
-            cancel_btn = GradientButton(button_frame,
-                                        text="Cancel",
-                                        command=cancel_quit,
-                                        width=70,
-                                        height=30,
-                                        start_color='#6B7280',
-                                        end_color='#4B5563')
-            cancel_btn.pack(side=tk.LEFT)
-
-            # Bind Escape key to cancel
-            dialog.bind('<Escape>', lambda e: cancel_quit())
-            dialog.focus()
-        else:
-            # No unsaved work, quit immediately
+        def quit_without_saving():
             self.root.destroy()
 
-    def has_unsaved_work(self):
-        """Check if there are any unsaved changes"""
-        # Check if project is open and has unsaved files
-        if self.current_project_path and len(self.unsaved_files) > 0:
-            return True
+        def cancel_quit():
+            dialog.grab_release()
+            dialog.withdraw()
+
+        # Save and quit button
+        save_btn = GradientButton(button_frame,
+                                  text="Save & Quit",
+                                  command=save_and_quit,
+                                  width=100,
+                                  height=30,
+                                  start_color='#22C55E',
+                                  end_color='#16A34A')
+        save_btn.pack(side=tk.LEFT, padx=(0, 10))
+
+        # Quit without saving button
+        quit_btn = GradientButton(button_frame,
+                                  text="Quit",
+                                  command=quit_without_saving,
+                                  width=70,
+                                  height=30,
+                                  start_color='#EF4444',
+                                  end_color='#DC2626')
+        quit_btn.pack(side=tk.LEFT, padx=(0, 10))
+
+        # Cancel button
+        cancel_btn = GradientButton(button_frame,
+                                    text="Cancel",
+                                    command=cancel_quit,
+                                    width=70,
+                                    height=30,
+                                    start_color='#6B7280',
+                                    end_color='#4B5563')
+        cancel_btn.pack(side=tk.LEFT)
 
-        # Check if any open editor tabs have unsaved content
-        for file_path, file_info in self.file_contents.items():
-            if file_info.get('modified', False):
-                return True
+        # Escape and the window close button cancel as well
+        dialog.bind('<Escape>', lambda e: cancel_quit())
+        dialog.protocol("WM_DELETE_WINDOW", cancel_quit)
+        return dialog
 
-        return False
+    def has_unsaved_work(self):
+        """Check if there are any unsaved changes"""
+        return bool(self.unsaved_files)
 
     def mark_file_modified(self, file_path):
         """Mark a file as having unsaved changes"""
+        if file_path in self.unsaved_files:
+            return
         self.unsaved_files.add(file_path)
-        if file_path in self.file_contents:
-            self.file_contents[file_path]['modified'] = True
 
         # Update window title to show unsaved indicator
         self.update_window_title()
@@ -1606,8 +2069,6 @@ Happy game development!
     def mark_file_saved(self, file_path):
         """Mark a file as saved"""
         self.unsaved_files.discard(file_path)
-        if file_path in self.file_contents:
-            self.file_contents[file_path]['modified'] = False
 
         # Update window title
         self.update_window_title()
@@ -1628,15 +2089,8 @@ Happy game development!
                     # Check if the click was on the close button (✕)
                     if "✕" in tab_text:
                         # Find the file path associated with this tab
-                        tab_widget = self.editor_notebook.nametowidget(
+                        tab_name = self.widget_to_file.get(
                             self.editor_notebook.tabs()[clicked_tab])
-                        tab_name = None
-
-                        for file_path, file_info in self.file_contents.items():
-                            if file_info['text_widget'].winfo_parent() == str(
-                                    tab_widget):
-                                tab_name = file_path
-                                break
 
                         # Calculate approximate position of close button (✕)
                         # Get tab text without close button to estimate text width
@@ -1644,8 +2098,13 @@ Happy game development!
 
                         # Get font and calculate text width
                         try:
-                            font = tkfont.nametofont("TkDefaultFont")
-                            text_width = font.measure(text_without_close)
+                            text_width = self.tab_label_widths.get(
+                                text_without_close)
+                            if text_width is None:
+                                text_width = self.tab_font.measure(
+                                    text_without_close)
+                                self.tab_label_widths[
+                                    text_without_close] = text_width
                             close_button_start = text_width + 10  # Add some padding
 
                             # Get tab boundaries
@@ -1678,7 +2137,7 @@ Happy game development!
             if file_path and file_path in self.unsaved_files:
                 result = messagebox.askyesnocancel(
                     "Unsaved Changes",
-                    f"'{os.path.basename(file_path)}' has unsaved changes.\nSave before closing?",
+                    f"'{self.file_display_name(file_path)}' has unsaved changes.\nSave before closing?",
                     icon='warning')
 
                 if result is None:  # Cancel
@@ -1686,39 +2145,21 @@ Happy game development!
                 elif result:  # Yes - save
                     if file_path in self.file_contents:
                         try:
-                            content = self.file_contents[file_path][
-                                'text_widget'].get('1.0', 'end-1c')
-                            with open(file_path, 'w',
-                                      encoding='utf-8') as file:
-                                file.write(content)
+                            content = self.file_contents[
+                                file_path].text_widget.get('1.0', 'end-1c')
+                            write_text_file(file_path, content)
                             self.mark_file_saved(file_path)
                         except Exception as e:
                             messagebox.showerror("Error",
                                                  f"Could not save file: {e}")
                             return
 
-            # Remove from notebook
-            self.editor_notebook.forget(tab_index)
+            # Destroying the frame removes the tab and its file tracking
+            tab_widget = self.editor_notebook.tabs()[tab_index]
+            self.editor_notebook.nametowidget(tab_widget).destroy()
 
-            # Clean up file tracking
-            if file_path:
-                if file_path in self.file_contents:
-                    del self.file_contents[file_path]
-                self.unsaved_files.discard(file_path)
-                if self.current_file == file_path:
-                    # Set current file to the currently selected tab if any
-                    current_tab = self.editor_notebook.select()
-                    if current_tab:
-                        # Find the file path for the current tab
-                        for fp, file_info in self.file_contents.items():
-                            if file_info['text_widget'].winfo_parent(
-                            ) == current_tab:
-                                self.current_file = fp
-                                break
-                        else:
-                            self.current_file = None
-                    else:
-                        self.current_file = None
+            # Closing the last tab doesn't raise <<NotebookTabChanged>>
+            self.on_editor_tab_changed()
 
             self.update_window_title()
             self.update_status("Tab closed")
@@ -1726,12 +2167,67 @@ Happy game development!
         except Exception as e:
             print(f"Error closing tab: {e}")
 
+    def close_all_tabs(self):
+        """Close every editor tab, asking once about unsaved files"""
+        unsaved = sorted(self.file_display_name(file_path)
+                         for file_path in self.unsaved_files
+                         if file_path in self.file_contents)
+        if unsaved:
+            names = "\n".join(unsaved)
+            result = messagebox.askyesnocancel(
+                "Unsaved Changes",
+                f"These files have unsaved changes:\n{names}\n\nSave before closing?",
+                icon='warning')
+            if result is None:  # Cancel
+                return
+            if result:  # Yes - save
+                if not self.save_all_files():
+                    messagebox.showerror("Error",
+                                         "Some files could not be saved")
+                    return
+
+        # Each frame's <Destroy> drops its file tracking
+        for tab_widget in self.editor_notebook.tabs():
+            self.editor_notebook.nametowidget(tab_widget).destroy()
+
+        self.on_editor_tab_changed()
+        self.update_window_title()
+        self.update_status("All tabs closed")
+
+    def on_editor_frame_destroyed(self, event):
+        """Drop the tracking of a file whose editor tab was destroyed"""
+        file_path = self.widget_to_file.pop(str(event.widget), None)
+        state = self.file_contents.get(file_path)
+        # Only the tab that owns the entry may drop it
+        if state is not None and state.frame is event.widget:
+            del self.file_contents[file_path]
+            self.unsaved_files.discard(file_path)
+
+    def file_display_name(self, file_path):
+        """Return the cached tab name for an open file"""
+        state = self.file_contents.get(file_path)
+        if state is not None:
+            return state.display_name
+        return os.path.basename(file_path)
+
+    def set_project_path(self, project_path):
+        """Set the current project and cache its display name"""
+        self.current_project_path = project_path
+        self.project_display_name = (os.path.basename(project_path)
+                                     if project_path else None)
+
     def update_window_title(self):
-        """Update window title with unsaved indicator"""
+        """Update window title on the next idle tick"""
+        if not self.title_dirty:
+            self.title_dirty = True
+            self.root.after_idle(self.flush_window_title)
+
+    def flush_window_title(self):
+        """Set window title with unsaved indicator"""
+        self.title_dirty = False
         base_title = "Axarion Engine Editor"
         if self.current_project_path:
-            project_name = os.path.basename(self.current_project_path)
-            base_title += f" - {project_name}"
+            base_title += f" - {self.project_display_name}"
 
         if len(self.unsaved_files) > 0:
             base_title += " *"
@@ -1739,80 +2235,80 @@ Happy game development!
         self.root.title(base_title)
 
     def save_all_files(self):
-        """Save all open files that have unsaved changes"""
+        """Save all open files with unsaved changes; True if all succeeded"""
+        # Read buffers on the Tk thread, then write them in parallel
+        pending = {}
+        failed = False
         for file_path in list(self.unsaved_files):
             if file_path in self.file_contents:
                 try:
-                    content = self.file_contents[file_path]['text_widget'].get(
-                        '1.0', 'end-1c')
-                    with open(file_path, 'w', encoding='utf-8') as file:
-                        file.write(content)
-                    self.mark_file_saved(file_path)
+                    pending[file_path] = self.file_contents[
+                        file_path].text_widget.get('1.0', 'end-1c')
                 except Exception as e:
                     print(f"Error saving file {file_path}: {e}")
+                    failed = True
+        if not pending and not failed:
+            self.update_status("All files saved")
+            return True
 
+        with ThreadPoolExecutor(max_workers=min(8, len(pending) or 1)) as pool:
+            futures = {
+                file_path: pool.submit(write_text_file, file_path, content)
+                for file_path, content in pending.items()
+            }
+
+        # Every write has finished once the pool has shut down
+        for file_path, future in futures.items():
+            error = future.exception()
+            if error is None:
+                self.mark_file_saved(file_path)
+            else:
+                print(f"Error saving file {file_path}: {error}")
+                failed = True
+
+        if failed:
+            self.update_status("Some files could not be saved")
+            return False
         self.update_status("All files saved")
+        return True
 
     def show_about_window(self):
         """Show the About window with engine information"""
+        dialog = self.about_dialog
+        if dialog is not None and dialog.winfo_exists():
+            dialog.deiconify()
+            dialog.lift()
+            dialog.grab_set()
+            dialog.focus()
+            return
+
         # Create about dialog
         dialog = tk.Toplevel(self.root)
+        self.about_dialog = dialog
         dialog.title("About Axarion Engine Editor")
-        dialog.geometry("520x650")
+        self.center_dialog(dialog, 520, 650)
         dialog.configure(bg='#0C0F2E')
         dialog.resizable(False, False)
         dialog.transient(self.root)
         dialog.grab_set()
 
-        # Center dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (dialog.winfo_width() // 2)
-        y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() // 2)
-        dialog.geometry(f'+{x}+{y}')
-
         # Main content frame
         main_frame = tk.Frame(dialog, bg='#0C0F2E')
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
 
         # Logo section
         try:
-            logo_paths = [
-                "Logo.png",  # Current directory
-                "assets/Logo.png",  # Bundled assets
-                os.path.join(os.path.dirname(__file__),
-                             "Logo.png"),  # Script directory
-                os.path.join(os.path.dirname(__file__), "assets",
-                             "Logo.png")  # Script assets
-            ]
-
-            logo_found = False
-            for logo_path in logo_paths:
-                if os.path.exists(logo_path):
-                    if PIL_AVAILABLE:
-                        from PIL import Image, ImageTk
-                        logo_pil = Image.open(logo_path)
-                        logo_pil.thumbnail((200, 100),
-                                           Image.Resampling.LANCZOS)
-                        logo_image = ImageTk.PhotoImage(logo_pil)
-                        logo_label = tk.Label(main_frame,
-                                              image=logo_image,
-                                              bg='#0C0F2E')
-                        logo_label.image = logo_image  # Keep reference
-                        logo_label.pack(pady=(0, 20))
-                        logo_found = True
-                        break
-                    else:
-                        logo_image = tk.PhotoImage(file=logo_path)
-                        logo_image = logo_image.subsample(2, 2)
-                        logo_label = tk.Label(main_frame,
-                                              image=logo_image,
-                                              bg='#0C0F2E')
-                        logo_label.image = logo_image  # Keep reference
-                        logo_label.pack(pady=(0, 20))
-                        logo_found = True
-                        break
-
-            if not logo_found:
+            if AxarionStudio._ABOUT_LOGO_CACHE is None:
+                AxarionStudio._ABOUT_LOGO_CACHE = self.load_about_logo()
+            logo_image = AxarionStudio._ABOUT_LOGO_CACHE
+
+            if logo_image is not None:
+                logo_label = tk.Label(main_frame,
+                                      image=logo_image,
+                                      bg='#0C0F2E')
+                logo_label.image = logo_image  # Keep reference
+                logo_label.pack(pady=(0, 20))
+            else:
                 title_label = tk.Label(main_frame,
                                        text="AXARION ENGINE",
                                        font=('Segoe UI', 18, 'bold'),
@@ -1929,13 +2425,17 @@ Beta Tester: Jerry"""
                                fg='white')
         links_label.pack(pady=(5, 0))
 
+        def hide_dialog():
+            dialog.grab_release()
+            dialog.withdraw()
+
         # Close button
         button_frame = tk.Frame(main_frame, bg='#0C0F2E')
         button_frame.pack(pady=(20, 0))
 
         close_btn = GradientButton(button_frame,
                                    text="Close",
-                                   command=dialog.destroy,
+                                   command=hide_dialog,
                                    width=100,
                                    height=35,
                                    start_color='#9333EA',
@@ -1943,12 +2443,15 @@ Beta Tester: Jerry"""
         close_btn.pack()
 
         # Bind Escape key to close
-        dialog.bind('<Escape>', lambda e: dialog.destroy())
+        dialog.bind('<Escape>', lambda e: hide_dialog())
+        dialog.protocol("WM_DELETE_WINDOW", hide_dialog)
         dialog.focus()
 
     def open_asset_manager(self):
         """Open the Asset Manager window"""
-        if not ASSET_MANAGER_AVAILABLE:
+        try:
+            from asset_manager.asset_manager import AssetManagerWindow
+        except ImportError:
             messagebox.showerror(
                 "Error",
                 "Asset Manager is not available. Please install required dependencies:\n"
@@ -1970,7 +2473,6 @@ Beta Tester: Jerry"""
     def open_game_builder(self):
         """Open the Game Builder as a separate process"""
         try:
-            import subprocess
             import sys
             import threading
             
@@ -2004,8 +2506,8 @@ Beta Tester: Jerry"""
                 if os.path.exists(game_builder_path):
                     try:
                         # Try subprocess first
-                        subprocess.Popen([sys.executable, game_builder_path], 
-                                       cwd=os.path.dirname(__file__))
+                        self.spawn_child([sys.executable, game_builder_path],
+                                         cwd=os.path.dirname(__file__))
                         self.update_status("Launched Axarion Game Builder")
                     except Exception as subprocess_error:
                         # Fallback to direct import
@@ -2049,11 +2551,13 @@ Beta Tester: Jerry"""
                               insertbackground='white',
                               selectbackground='#264F78')
         text_editor.pack(fill=tk.BOTH, expand=True)
+        editor_frame.text_widget = text_editor
+        editor_frame.bind('<Destroy>', self.on_editor_frame_destroyed)
 
         # Setup syntax highlighting
         highlighter = SyntaxHighlighter(text_editor)
-        text_editor.bind('<KeyRelease>', highlighter.highlight_syntax)
-        text_editor.bind('<Button-1>', highlighter.highlight_syntax)
+        text_editor.bind('<KeyRelease>', highlighter.schedule_highlight)
+        text_editor.config(yscrollcommand=highlighter.schedule_viewport)
 
         self.editor_notebook.add(editor_frame, text="Untitled  ✕")
         self.editor_notebook.select(editor_frame)
@@ -2063,13 +2567,7 @@ Beta Tester: Jerry"""
     def open_file(self):
         """Open file dialog"""
         file_path = filedialog.askopenfilename(title="Open File",
-                                               filetypes=[
-                                                   ("Python files", "*.py"),
-                                                   ("Text files", "*.txt"),
-                                                   ("Markdown files", "*.md"),
-                                                   ("JSON files", "*.json"),
-                                                   ("All files", "*.*")
-                                               ])
+                                               filetypes=self._OPEN_FILETYPES)
 
         if file_path:
             self.open_file_in_editor(file_path)
@@ -2077,14 +2575,16 @@ Beta Tester: Jerry"""
     def save_file(self):
         """Save current file"""
         if self.current_file and self.current_file in self.file_contents:
+            text_widget = self.file_contents[self.current_file].text_widget
+            if self.buffer_is_loading(text_widget):
+                self.update_status("File is still loading; try again shortly")
+                return
             try:
-                content = self.file_contents[
-                    self.current_file]['text_widget'].get('1.0', 'end-1c')
-                with open(self.current_file, 'w', encoding='utf-8') as file:
-                    file.write(content)
+                content = text_widget.get('1.0', 'end-1c')
+                write_text_file(self.current_file, content)
                 self.mark_file_saved(self.current_file)
                 self.update_status(
-                    f"Saved: {os.path.basename(self.current_file)}")
+                    f"Saved: {self.file_contents[self.current_file].display_name}")
             except Exception as e:
                 messagebox.showerror("Error", f"Could not save file: {e}")
         else:
@@ -2092,82 +2592,77 @@ Beta Tester: Jerry"""
 
     def save_as_file(self):
         """Save file as dialog"""
+        text_widget = self.get_current_text_widget()
+        if text_widget and self.buffer_is_loading(text_widget):
+            self.update_status("File is still loading; try again shortly")
+            return
         file_path = filedialog.asksaveasfilename(title="Save File As",
                                                  defaultextension=".py",
-                                                 filetypes=[
-                                                     ("Python files", "*.py"),
-                                                     ("Text files", "*.txt"),
-                                                     ("All files", "*.*")
-                                                 ])
+                                                 filetypes=self._SAVE_FILETYPES)
 
         if file_path:
             try:
                 # Get current tab content
-                current_tab = self.editor_notebook.select()
-                if current_tab:
-                    # Find text widget in current tab
-                    for widget in self.editor_notebook.nametowidget(
-                            current_tab).winfo_children():
-                        text_widget = self.find_text_widget(widget)
-                        if text_widget:
-                            content = text_widget.get('1.0', 'end-1c')
-                            with open(file_path, 'w',
-                                      encoding='utf-8') as file:
-                                file.write(content)
-                            self.current_file = file_path
-                            self.mark_file_saved(file_path)
-                            self.update_status(
-                                f"Saved as: {os.path.basename(file_path)}")
-                            break
+                text_widget = self.get_current_text_widget()
+                if text_widget:
+                    content = text_widget.get('1.0', 'end-1c')
+                    write_text_file(file_path, content)
+                    current_tab = self.editor_notebook.select()
+                    old_path = self.widget_to_file.get(current_tab)
+                    state = self.file_contents.get(old_path)
+                    if (old_path != file_path and state is not None and
+                            str(state.frame) == current_tab):
+                        # Tracking follows the tab to its new path
+                        del self.file_contents[old_path]
+                        self.unsaved_files.discard(old_path)
+                        state.display_name = os.path.basename(file_path)
+                        self.file_contents[file_path] = state
+                        self.editor_notebook.tab(
+                            current_tab, text=f"{state.display_name}  ✕")
+                    self.current_file = file_path
+                    self.widget_to_file[current_tab] = file_path
+                    self.mark_file_saved(file_path)
+                    self.update_status(
+                        f"Saved as: {os.path.basename(file_path)}")
             except Exception as e:
                 messagebox.showerror("Error", f"Could not save file: {e}")
 
-    def find_text_widget(self, widget):
-        """Recursively find Text widget"""
-        if isinstance(widget, tk.Text):
-            return widget
-        for child in widget.winfo_children():
-            result = self.find_text_widget(child)
-            if result:
-                return result
-        return None
+    def on_editor_tab_changed(self, event=None):
+        """Remember the text widget and file of the selected tab"""
+        current_tab = self.editor_notebook.select()
+        tab_widget = None
+        if current_tab:
+            try:
+                tab_widget = self.editor_notebook.nametowidget(current_tab)
+            except KeyError:
+                pass
+        self.current_text_widget = getattr(tab_widget, 'text_widget', None)
+        self.current_file = self.widget_to_file.get(current_tab)
 
     def get_current_text_widget(self):
         """Get the text widget from currently active tab"""
-        current_tab = self.editor_notebook.select()
-        if not current_tab:
-            return None
-
-        try:
-            tab_widget = self.editor_notebook.nametowidget(current_tab)
-            return self.find_text_widget(tab_widget)
-        except tk.TclError:
-            return None
+        return self.current_text_widget
 
     # Edit operations
     def undo(self):
         """Undo last action"""
-        current_tab = self.editor_notebook.select()
-        if current_tab:
-            text_widget = self.get_current_text_widget()
-            if text_widget:
-                try:
-                    text_widget.edit_undo()
-                    self.update_status("Undo performed")
-                except tk.TclError:
-                    self.update_status("Nothing to undo")
+        text_widget = self.get_current_text_widget()
+        if text_widget:
+            try:
+                text_widget.edit_undo()
+                self.update_status("Undo performed")
+            except tk.TclError:
+                self.update_status("Nothing to undo")
 
     def redo(self):
         """Redo last undone action"""
-        current_tab = self.editor_notebook.select()
-        if current_tab:
-            text_widget = self.get_current_text_widget()
-            if text_widget:
-                try:
-                    text_widget.edit_redo()
-                    self.update_status("Redo performed")
-                except tk.TclError:
-                    self.update_status("Nothing to redo")
+        text_widget = self.get_current_text_widget()
+        if text_widget:
+            try:
+                text_widget.edit_redo()
+                self.update_status("Redo performed")
+            except tk.TclError:
+                self.update_status("Nothing to redo")
 
     def find_text(self):
         """Open find dialog"""
@@ -2179,18 +2674,12 @@ Beta Tester: Jerry"""
         # Create find dialog
         dialog = tk.Toplevel(self.root)
         dialog.title("Find")
-        dialog.geometry("400x150")
+        self.center_dialog(dialog, 400, 150)
         dialog.configure(bg='#0C0F2E')
         dialog.resizable(False, False)
         dialog.transient(self.root)
         dialog.grab_set()
 
-        # Center dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (dialog.winfo_width() // 2)
-        y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() // 2)
-        dialog.geometry(f'+{x}+{y}')
-
         # Dialog content
         tk.Label(dialog,
                  text="Find:",
@@ -2212,34 +2701,56 @@ Beta Tester: Jerry"""
         button_frame = tk.Frame(dialog, bg='#0C0F2E')
         button_frame.pack(pady=15)
 
-        def find_next():
+        # The dialog grabs input, so the buffer can't change while it is
+        # open: each search term is located once, then reused
+        match_cache = {}
+        # Only the previous match carries the highlight tag
+        last_range = []
+        text_widget.tag_configure("highlight",
+                                  background="#FFD700",
+                                  foreground="black")
+
+        def find_matches(search_term):
+            matches = match_cache.get(search_term)
+            if matches is None:
+                matches = []
+                content = text_widget.get('1.0', 'end-1c')
+                for line_no, line in enumerate(content.split('\n'), 1):
+                    col = line.find(search_term)
+                    while col != -1:
+                        matches.append((line_no, col))
+                        col = line.find(search_term, col + 1)
+                match_cache[search_term] = matches
+            return matches
+
+        def find_next(event=None):
             search_term = search_var.get()
             if search_term:
-                # Clear previous highlights
-                text_widget.tag_remove("highlight", "1.0", "end")
-
-                # Get current cursor position
-                current_pos = text_widget.index(tk.INSERT)
-
-                # Search from current position
-                pos = text_widget.search(search_term, current_pos, "end")
-                if not pos:
-                    # Search from beginning
-                    pos = text_widget.search(search_term, "1.0", current_pos)
+                # Clear the previous highlight
+                if last_range:
+                    text_widget.tag_remove("highlight", *last_range)
+                    last_range.clear()
+
+                # Next match from the cursor, wrapping to the beginning
+                matches = find_matches(search_term)
+                pos = None
+                if matches:
+                    line, col = text_widget.index(tk.INSERT).split('.')
+                    i = bisect_left(matches, (int(line), int(col)))
+                    line, col = matches[i % len(matches)]
+                    pos = f"{line}.{col}"
 
                 if pos:
-                    end = f"{pos}+{len(search_term)}c"
+                    end = column_offset(pos, len(search_term))
                     text_widget.tag_add("highlight", pos, end)
-                    text_widget.tag_configure("highlight",
-                                              background="#FFD700",
-                                              foreground="black")
+                    last_range[:] = (pos, end)
                     text_widget.mark_set(tk.INSERT, end)
                     text_widget.see(pos)
                     self.update_status(f"Found: {search_term}")
                 else:
                     self.update_status(f"Not found: {search_term}")
 
-        def close_dialog():
+        def close_dialog(event=None):
             text_widget.tag_remove("highlight", "1.0", "end")
             dialog.destroy()
 
@@ -2259,8 +2770,8 @@ Beta Tester: Jerry"""
                        end_color='#F472B6').pack(side=tk.LEFT, padx=5)
 
         # Bind Enter key
-        dialog.bind('<Return>', lambda e: find_next())
-        dialog.bind('<Escape>', lambda e: close_dialog())
+        dialog.bind('<Return>', find_next)
+        dialog.bind('<Escape>', close_dialog)
 
     def replace_text(self):
         """Open replace dialog"""
@@ -2272,18 +2783,12 @@ Beta Tester: Jerry"""
         # Create replace dialog
         dialog = tk.Toplevel(self.root)
         dialog.title("Replace")
-        dialog.geometry("400x200")
+        self.center_dialog(dialog, 400, 200)
         dialog.configure(bg='#0C0F2E')
         dialog.resizable(False, False)
         dialog.transient(self.root)
         dialog.grab_set()
 
-        # Center dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (dialog.winfo_width() // 2)
-        y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() // 2)
-        dialog.geometry(f'+{x}+{y}')
-
         # Dialog content
         tk.Label(dialog,
                  text="Find:",
@@ -2321,7 +2826,7 @@ Beta Tester: Jerry"""
         button_frame = tk.Frame(dialog, bg='#0C0F2E')
         button_frame.pack(pady=15)
 
-        def replace_next():
+        def replace_next(event=None):
             find_text = find_var.get()
             replace_text = replace_var.get()
             if find_text:
@@ -2331,11 +2836,11 @@ Beta Tester: Jerry"""
                     pos = text_widget.search(find_text, "1.0", current_pos)
 
                 if pos:
-                    end = f"{pos}+{len(find_text)}c"
+                    end = column_offset(pos, len(find_text))
                     text_widget.delete(pos, end)
                     text_widget.insert(pos, replace_text)
                     text_widget.mark_set(tk.INSERT,
-                                         f"{pos}+{len(replace_text)}c")
+                                         column_offset(pos, len(replace_text)))
                     self.update_status(
                         f"Replaced: {find_text} → {replace_text}")
                 else:
@@ -2345,17 +2850,41 @@ Beta Tester: Jerry"""
             find_text = find_var.get()
             replace_text = replace_var.get()
             if find_text:
-                content = text_widget.get("1.0", "end-1c")
-                count = content.count(find_text)
-                if count > 0:
-                    new_content = content.replace(find_text, replace_text)
-                    text_widget.delete("1.0", "end")
-                    text_widget.insert("1.0", new_content)
+                # Splitting finds every match in a single scan
+                parts = text_widget.get("1.0", "end-1c").split(find_text)
+                count = len(parts) - 1
+                if count > self.REPLACE_IN_PLACE_LIMIT:
+                    # One Tcl call, undone as a single edit
+                    text_widget.replace("1.0", "end-1c",
+                                        replace_text.join(parts))
+                    text_widget.event_generate('<<Rehighlight>>')
+                    self.update_status(f"Replaced {count} occurrences")
+                elif count > 0:
+                    # Patch each match in place so the rest of the buffer
+                    # keeps its tags and marks
+                    matches = []
+                    line, col = 1, 0
+                    for part in parts[:-1]:
+                        line, col = text_end(part, line, col)
+                        matches.append((line, col))
+                        line, col = text_end(find_text, line, col)
+
+                    text_widget.configure(autoseparators=False)
+                    text_widget.edit_separator()
+                    # Replacing back to front keeps earlier indices valid
+                    for line, col in reversed(matches):
+                        end_line, end_col = text_end(find_text, line, col)
+                        text_widget.replace(f"{line}.{col}",
+                                            f"{end_line}.{end_col}",
+                                            replace_text)
+                    text_widget.edit_separator()
+                    text_widget.configure(autoseparators=True)
+                    text_widget.event_generate('<<Rehighlight>>')
                     self.update_status(f"Replaced {count} occurrences")
                 else:
                     self.update_status(f"Not found: {find_text}")
 
-        def close_dialog():
+        def close_dialog(event=None):
             dialog.destroy()
 
         GradientButton(button_frame,
@@ -2381,32 +2910,47 @@ Beta Tester: Jerry"""
                        end_color='#F472B6').pack(side=tk.LEFT, padx=2)
 
         # Bind keys
-        dialog.bind('<Return>', lambda e: replace_next())
-        dialog.bind('<Escape>', lambda e: close_dialog())
+        dialog.bind('<Return>', replace_next)
+        dialog.bind('<Escape>', close_dialog)
+
+    def spawn_child(self, args, cwd=None):
+        """Start a child process and remember it for stop_execution"""
+        # Forget children that have already exited
+        self.child_processes = [
+            process for process in self.child_processes
+            if process.poll() is None
+        ]
+        # On POSIX the child leads its own process group, so stopping it
+        # also stops anything it started
+        process = subprocess.Popen(args,
+                                   cwd=cwd,
+                                   start_new_session=os.name != 'nt')
+        self.child_processes.append(process)
+        return process
 
     def stop_execution(self):
-        """Stop current execution by killing Python processes"""
+        """Stop the processes started by the editor"""
         try:
-            if os.name == 'nt':  # Windows
-                # Kill all Python processes that might be running our game
-                subprocess.run(['taskkill', '/f', '/im', 'python.exe'],
-                               capture_output=True,
-                               text=True)
-                subprocess.run(['taskkill', '/f', '/im', 'pythonw.exe'],
-                               capture_output=True,
-                               text=True)
-            else:  # Linux/Mac
-                # Kill Python processes that contain our current file
-                if self.current_file:
-                    filename = os.path.basename(self.current_file)
-                    subprocess.run(['pkill', '-f', filename],
-                                   capture_output=True,
-                                   text=True)
+            running = [
+                process for process in self.child_processes
+                if process.poll() is None
+            ]
+            for process in running:
+                if os.name == 'nt':
+                    process.terminate()
                 else:
-                    # Kill all Python processes (be careful!)
-                    subprocess.run(['pkill', '-f', 'python'],
-                                   capture_output=True,
-                                   text=True)
+                    try:
+                        os.killpg(process.pid, signal.SIGTERM)
+                    except ProcessLookupError:
+                        pass
+
+            # Give them a moment to exit cleanly before killing them
+            for process in running:
+                try:
+                    process.wait(timeout=0.2)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+            self.child_processes.clear()
 
             self.update_status("Execution stopped")
 
@@ -2422,14 +2966,7 @@ Beta Tester: Jerry"""
             project_path = self.current_project_path
         elif self.current_file:
             # Try to find project based on current file
-            file_path = Path(self.current_file)
-            if "Projects" in file_path.parts:
-                # Find the project directory
-                parts = file_path.parts
-                projects_index = parts.index("Projects")
-                if projects_index + 1 < len(parts):
-                    project_name = parts[projects_index + 1]
-                    project_path = str(Path("Projects") / project_name)
+            project_path = project_root_of(self.current_file)
 
         if not project_path or not os.path.exists(project_path):
             messagebox.showwarning(
@@ -2446,22 +2983,34 @@ Beta Tester: Jerry"""
             return
 
         # Update current project path
-        self.current_project_path = project_path
+        self.set_project_path(project_path)
+
+        # The build dialog is built once and reused
+        dialog = self.build_dialog
+        if dialog is not None and dialog.winfo_exists():
+            self.build_progress_text.delete("1.0", "end")
+            dialog.deiconify()
+            dialog.lift()
+        else:
+            dialog = self.create_build_dialog()
+        dialog.grab_set()
 
-        # Create build dialog
+    def create_build_dialog(self):
+        """Create the build dialog; closing it hides it for reuse"""
         dialog = tk.Toplevel(self.root)
+        self.build_dialog = dialog
         dialog.title("Build Project")
-        dialog.geometry("500x350")
+        self.center_dialog(dialog, 500, 350)
         dialog.configure(bg='#0C0F2E')
         dialog.resizable(False, False)
         dialog.transient(self.root)
-        dialog.grab_set()
 
-        # Center dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (dialog.winfo_width() // 2)
-        y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() // 2)
-        dialog.geometry(f'+{x}+{y}')
+        def hide_dialog():
+            dialog.grab_release()
+            dialog.withdraw()
+
+        dialog.protocol("WM_DELETE_WINDOW", hide_dialog)
+        dialog.bind('<Escape>', lambda e: hide_dialog())
 
         # Dialog content
         title_label = tk.Label(dialog,
@@ -2492,6 +3041,7 @@ Beta Tester: Jerry"""
                                                   fg='white',
                                                   font=('Consolas', 9))
         progress_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.build_progress_text = progress_text
 
         # Buttons
         button_frame = tk.Frame(dialog, bg='#0C0F2E')
@@ -2500,24 +3050,17 @@ Beta Tester: Jerry"""
         build_btn = None
         cancel_btn = None
 
+        return dialog
+
     def run(self):
         """Start the application"""
         # Set icon if available (check multiple locations for bundled app)
         try:
-            icon_paths = [
-                "favicon.png",  # Current directory
-                "assets/favicon.png",  # Bundled assets
-                os.path.join(os.path.dirname(__file__),
-                             "favicon.png"),  # Script directory
-                os.path.join(os.path.dirname(__file__), "assets",
-                             "favicon.png")  # Script assets
-            ]
-
-            for icon_path in icon_paths:
-                if os.path.exists(icon_path):
-                    icon = tk.PhotoImage(file=icon_path)
-                    self.root.iconphoto(False, icon)
-                    break
+            icon_path = find_asset("favicon.png")
+            if icon_path:
+                # Decoded once; as the default icon every dialog reuses it
+                self.icon_image = tk.PhotoImage(file=icon_path)
+                self.root.iconphoto(True, self.icon_image)
 
         except Exception as e:
             print(f"Could not load favicon: {e}")
@@ -21,6 +21,9 @@ except ImportError:
 class GradientButton(tk.Canvas):
     """Custom gradient button widget"""
 
+    # Rendered gradients, keyed by (width, height, start, end, state)
+    _IMAGE_CACHE = {}
+
     def __init__(self,
                  parent,
                  text="",
@@ -50,6 +53,19 @@ class GradientButton(tk.Canvas):
         self.bind("<Enter>", self.on_enter)
         self.bind("<Leave>", self.on_leave)
 
+        # Canvas items are created once; redraws swap the gradient image
+        self._grad_id = self.create_image(0, 0, anchor='nw')
+        self.create_rectangle(0,
+                              0,
+                              self.width,
+                              self.height,
+                              outline="#444",
+                              width=1)
+        self._text_id = self.create_text(self.width // 2,
+                                         self.height // 2,
+                                         fill=self.text_color,
+                                         font=('Segoe UI', 9, 'bold'))
+
         self.draw_gradient()
 
     def update_colors(self, start_color=None, end_color=None, text=None):
@@ -78,8 +94,18 @@ class GradientButton(tk.Canvas):
 
     def draw_gradient(self, hover=False, pressed=False):
         """Draw the gradient background"""
-        self.delete("all")
-
+        state = "pressed" if pressed else "hover" if hover else "normal"
+        key = (self.width, self.height, self.start_color, self.end_color,
+               state)
+        image = self._IMAGE_CACHE.get(key)
+        if image is None:
+            image = self.render_gradient(hover, pressed)
+            self._IMAGE_CACHE[key] = image
+        self.itemconfigure(self._grad_id, image=image)
+        self.itemconfigure(self._text_id, text=self.text)
+
+    def render_gradient(self, hover, pressed):
+        """Render the gradient into an image"""
         start_rgb = self.hex_to_rgb(self.start_color)
         end_rgb = self.hex_to_rgb(self.end_color)
 
@@ -91,27 +117,16 @@ class GradientButton(tk.Canvas):
             start_rgb = tuple(min(255, c + 20) for c in start_rgb)
             end_rgb = tuple(min(255, c + 20) for c in end_rgb)
 
-        # Create gradient
+        # One color per row; put() tiles the column across the width
+        rows = []
         for i in range(self.height):
             factor = i / self.height
             color_rgb = self.interpolate_color(start_rgb, end_rgb, factor)
-            color_hex = self.rgb_to_hex(color_rgb)
-            self.create_line(0, i, self.width, i, fill=color_hex, width=1)
-
-        # Add rounded rectangle border
-        self.create_rectangle(0,
-                              0,
-                              self.width,
-                              self.height,
-                              outline="#444",
-                              width=1)
-
-        # Add text
-        self.create_text(self.width // 2,
-                         self.height // 2,
-                         text=self.text,
-                         fill=self.text_color,
-                         font=('Segoe UI', 9, 'bold'))
+            rows.append(f"{{{self.rgb_to_hex(color_rgb)}}}")
+        image = tk.PhotoImage(master=self, width=self.width,
+                              height=self.height)
+        image.put(" ".join(rows), to=(0, 0, self.width, self.height))
+        return image
 
     def on_click(self, event):
         self.is_pressed = True
@@ -145,7 +160,13 @@ class AxarionGameBuilder:
         self.selected_icon_file = None
         self.build_thread = None
         self.building = False
+        self.build_process = None  # Running PyInstaller, if any
+        self.build_cancelled = False
         self.icon_status_label = None
+        # Console lines waiting to be shown; filled from the build thread
+        self.log_queue = []
+        self.log_lock = threading.Lock()
+        self.log_flush_pending = False
 
         self.setup_ui()
 
@@ -452,17 +473,31 @@ class AxarionGameBuilder:
             self.log_message(f"✓ Game file selected: {filename}")
 
     def log_message(self, message):
-        """Add message to console"""
+        """Queue a message for the console; safe from the build thread"""
+        with self.log_lock:
+            self.log_queue.append(f"{message}\n")
+            if self.log_flush_pending:
+                return
+            self.log_flush_pending = True
+        # First message since the last flush: show the batch in 50 ms
+        self.root.after(50, self.flush_log)
+
+    def flush_log(self):
+        """Show queued console messages in one insert"""
+        with self.log_lock:
+            lines = self.log_queue
+            self.log_queue = []
+            self.log_flush_pending = False
         self.console_text.configure(state='normal')
-        self.console_text.insert(tk.END, f"{message}\n")
+        self.console_text.insert(tk.END, "".join(lines))
         self.console_text.configure(state='disabled')
         self.console_text.see(tk.END)
-        self.root.update_idletasks()
 
     def start_build(self):
         """Start the build process"""
         if self.building:
-            self.log_message("❌ Build already in progress!")
+            # Clicking BUILD again while building cancels the build
+            self.cancel_build()
             return
 
         if not self.selected_game_file:
@@ -475,12 +510,23 @@ class AxarionGameBuilder:
 
         # Start build in separate thread
         self.building = True
-        self.build_btn.update_colors(start_color='#666666', end_color='#888888', text="BUILDING...")
-        self.build_btn_top.update_colors(start_color='#666666', end_color='#888888', text="BUILDING...")
+        self.build_cancelled = False
+        self.build_btn.update_colors(start_color='#666666', end_color='#888888', text="BUILDING... (CLICK TO CANCEL)")
+        self.build_btn_top.update_colors(start_color='#666666', end_color='#888888', text="CANCEL")
 
         self.build_thread = threading.Thread(target=self.build_game, daemon=True)
         self.build_thread.start()
 
+    def cancel_build(self):
+        """Stop the running build"""
+        if self.build_cancelled:
+            return
+        self.build_cancelled = True
+        self.log_message("🛑 Cancelling build...")
+        process = self.build_process
+        if process and process.poll() is None:
+            process.terminate()
+
     def build_game(self):
         """Build the game using PyInstaller with bundled engine"""
         try:
@@ -662,25 +708,42 @@ class AxarionGameBuilder:
                         self.log_message(f"  [{i}] {part}")
                 self.log_message("=" * 80)
 
-                # Run PyInstaller
+                # Run PyInstaller, streaming its output while it builds
                 self.log_message("🚀 Executing PyInstaller...")
-                result = subprocess.run(cmd, cwd=temp_dir, capture_output=True, text=True)
-
-                # Show PyInstaller output
                 self.log_message("=" * 80)
                 self.log_message("PYINSTALLER OUTPUT:")
-                if result.stdout:
-                    for line in result.stdout.split('\n'):
-                        if line.strip():
-                            self.log_message(f"OUT: {line}")
-                if result.stderr:
-                    for line in result.stderr.split('\n'):
+                if self.build_cancelled:
+                    self.log_message("🛑 Build cancelled")
+                    return
+                process = subprocess.Popen(cmd, cwd=temp_dir,
+                                           stdout=subprocess.PIPE,
+                                           stderr=subprocess.PIPE,
+                                           text=True, errors='replace',
+                                           bufsize=1)
+                self.build_process = process
+                if self.build_cancelled:
+                    # Cancel was clicked before build_process was set
+                    process.terminate()
+
+                def stream_output(pipe, prefix):
+                    for line in pipe:
                         if line.strip():
-                            self.log_message(f"ERR: {line}")
+                            self.log_message(f"{prefix}: {line.rstrip()}")
+
+                stderr_thread = threading.Thread(
+                    target=stream_output, args=(process.stderr, "ERR"),
+                    daemon=True)
+                stderr_thread.start()
+                stream_output(process.stdout, "OUT")
+                stderr_thread.join()
+                returncode = process.wait()
+
                 self.log_message("=" * 80)
-                self.log_message(f"PyInstaller exit code: {result.returncode}")
+                self.log_message(f"PyInstaller exit code: {returncode}")
 
-                if result.returncode == 0:
+                if self.build_cancelled:
+                    self.log_message("🛑 Build cancelled")
+                elif returncode == 0:
                     if self.build_single_exe.get():
                         # Single file build
                         exe_name = f"{game_name}.exe" if sys.platform == "win32" else game_name
@@ -728,14 +791,16 @@ class AxarionGameBuilder:
         except Exception as e:
             self.log_message(f"❌ Build failed with exception: {e}")
         finally:
-            # Reset build button
-            self.building = False
+            # Reset build button; building is cleared on the Tk thread so
+            # a new build can't start before the buttons are relabelled
+            self.build_process = None
             self.root.after(0, self.reset_build_button)
 
     def reset_build_button(self):
         """Reset build button to normal state"""
         self.build_btn.update_colors(start_color='#9333EA', end_color='#A855F7', text="BUILD")
         self.build_btn_top.update_colors(start_color='#9333EA', end_color='#A855F7', text="BUILD")
+        self.building = False
 
     def run(self):
         """Start the application"""